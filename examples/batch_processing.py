@@ -4,6 +4,7 @@ Batch Processing Example
 
 This example demonstrates how to process multiple XML files using the batch processor.
 """
+import os
 import sys
 from pathlib import Path
 
@@ -24,8 +25,10 @@ def batch_processing_example():
     output_dir = "batch_output"
     
     try:
-        # Get list of XML files
-        xml_files = list(Path(xml_directory).glob("*.xml"))
+        # Get list of XML files (scandir reports file type without a stat per entry)
+        with os.scandir(xml_directory) as entries:
+            xml_files = [entry.path for entry in entries
+                         if entry.is_file() and entry.name.lower().endswith('.xml')]
         print(f"Found {len(xml_files)} XML files")
         
         if not xml_files:
@@ -4,15 +4,37 @@ Database Integration Example
 
 This example demonstrates how to use the SQLite database functionality.
 """
+import os
 import sys
+from datetime import datetime
 from pathlib import Path
 
 # Add the src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from ra_d_ps import parse_multiple
+from ra_d_ps import parse_radiology_sample
 from ra_d_ps.radiology_database import RadiologyDatabase
 
+# Records gathered before each insert_batch_data call (whole files per batch)
+INSERT_BATCH_ROWS = 5000
+
+
+def iter_file_records(xml_files):
+    """Parse files one at a time, yielding each file's records (unblinded rows marked)"""
+    for xml_file in xml_files:
+        try:
+            main_df, unblinded_df = parse_radiology_sample(xml_file)
+        except Exception as e:
+            print(f"Error parsing {xml_file}: {e}")
+            continue
+        
+        records = main_df.to_dict('records')
+        # Mark unblinded data
+        for record in unblinded_df.to_dict('records'):
+            record['is_unblinded'] = True
+            records.append(record)
+        yield records
+
 
 def database_example():
     """Example of database integration workflow"""
@@ -24,40 +46,41 @@ def database_example():
     db_path = "radiology_analysis.db"
     
     try:
-        # Get list of XML files
-        xml_files = list(Path(xml_directory).glob("*.xml"))
+        # Get list of XML files (scandir reports file type without a stat per entry)
+        with os.scandir(xml_directory) as entries:
+            xml_files = [entry.path for entry in entries
+                         if entry.is_file() and entry.name.lower().endswith('.xml')]
         print(f"Found {len(xml_files)} XML files")
         
         if not xml_files:
             print("No XML files found in directory")
             return
         
-        # Parse multiple files
-        print("Parsing XML files...")
-        case_data, case_unblinded_data = parse_multiple(xml_files)
-        
-        if not case_data and not case_unblinded_data:
-            print("No data parsed from files")
-            return
-        
-        # Combine all data for database insertion
-        all_parsed_data = []
-        for df in case_data.values():
-            all_parsed_data.extend(df.to_dict('records'))
-        for df in case_unblinded_data.values():
-            unblinded_records = df.to_dict('records')
-            # Mark unblinded data
-            for record in unblinded_records:
-                record['is_unblinded'] = True
-            all_parsed_data.extend(unblinded_records)
-        
-        print(f"Total records to insert: {len(all_parsed_data)}")
-        
-        # Create database and insert data
-        print("Creating database and inserting data...")
+        # Parse files one at a time and insert about INSERT_BATCH_ROWS records per
+        # batch, so memory holds one batch instead of every parsed DataFrame plus
+        # a copy as dicts; a file's records never straddle two batches
+        print("Parsing XML files and inserting data...")
+        run_id = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        total_records = 0
+        batch_count = 0
         with RadiologyDatabase(db_path) as db:
-            batch_id = db.insert_batch_data(all_parsed_data)
-            print(f"Data inserted with batch ID: {batch_id}")
+            batch = []
+            for records in iter_file_records(xml_files):
+                batch.extend(records)
+                if len(batch) >= INSERT_BATCH_ROWS:
+                    batch_count += 1
+                    db.insert_batch_data(batch, f"{run_id}_{batch_count:05d}")
+                    total_records += len(batch)
+                    batch = []
+            if batch:
+                batch_count += 1
+                db.insert_batch_data(batch, f"{run_id}_{batch_count:05d}")
+                total_records += len(batch)
+            
+            print(f"Total records inserted: {total_records}")
+            if not total_records:
+                print("No data parsed from files")
+                return
             
             # Generate quality report
             print("Generating quality report...")
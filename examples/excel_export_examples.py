@@ -8,78 +8,91 @@ without the GUI.
 from pathlib import Path
 from src.ra_d_ps.exporters import RADPSExcelFormatter, TemplateExcelFormatter
 
+# Output folder shared by every example
+_DESKTOP = Path.home() / "Desktop"
+
+
+# Sample data is built once at import and shared by every example run
+_SAMPLE_RADPS_RECORDS = [
+    {
+        "file_number": "001",
+        "study_uid": "1.2.840.113619.2.55.3.12345",
+        "nodule_id": "Nodule001",
+        "radiologists": {
+            "1": {
+                "subtlety": 3,
+                "confidence": 4,
+                "obscuration": 2,
+                "reason": "ground glass opacity",
+                "coordinates": "100.5, 200.3, 50.2"
+            },
+            "2": {
+                "subtlety": 4,
+                "confidence": 5,
+                "obscuration": 1,
+                "reason": "well-circumscribed",
+                "coordinates": "102.1, 198.7, 51.0"
+            }
+        }
+    },
+    {
+        "file_number": "002",
+        "study_uid": "1.2.840.113619.2.55.3.54321",
+        "nodule_id": "Nodule002",
+        "radiologists": {
+            "1": {
+                "subtlety": 2,
+                "confidence": 3,
+                "obscuration": 3,
+                "reason": "partially obscured by vessel",
+                "coordinates": "150.0, 250.5, 60.3"
+            },
+            "2": {
+                "subtlety": 3,
+                "confidence": 4,
+                "obscuration": 2,
+                "reason": "",
+                "coordinates": "151.2, 249.8, 59.9"
+            },
+            "3": {
+                "subtlety": 2,
+                "confidence": 3,
+                "obscuration": 3,
+                "reason": "small nodule",
+                "coordinates": "149.5, 251.0, 60.5"
+            }
+        }
+    }
+]
+
+
+def _iter_sample_records():
+    """Yield sample RA-D-PS records (would come from parser in real usage)"""
+    yield from _SAMPLE_RADPS_RECORDS
+
 
 def example_radps_export():
     """Example: Export data in RA-D-PS format"""
     print("📊 RA-D-PS Excel Export Example")
     print("=" * 50)
     
-    # Sample data (would come from parser in real usage)
-    records = [
-        {
-            "file_number": "001",
-            "study_uid": "1.2.840.113619.2.55.3.12345",
-            "nodule_id": "Nodule001",
-            "radiologists": {
-                "1": {
-                    "subtlety": 3,
-                    "confidence": 4,
-                    "obscuration": 2,
-                    "reason": "ground glass opacity",
-                    "coordinates": "100.5, 200.3, 50.2"
-                },
-                "2": {
-                    "subtlety": 4,
-                    "confidence": 5,
-                    "obscuration": 1,
-                    "reason": "well-circumscribed",
-                    "coordinates": "102.1, 198.7, 51.0"
-                }
-            }
-        },
-        {
-            "file_number": "002",
-            "study_uid": "1.2.840.113619.2.55.3.54321",
-            "nodule_id": "Nodule002",
-            "radiologists": {
-                "1": {
-                    "subtlety": 2,
-                    "confidence": 3,
-                    "obscuration": 3,
-                    "reason": "partially obscured by vessel",
-                    "coordinates": "150.0, 250.5, 60.3"
-                },
-                "2": {
-                    "subtlety": 3,
-                    "confidence": 4,
-                    "obscuration": 2,
-                    "reason": "",
-                    "coordinates": "151.2, 249.8, 59.9"
-                },
-                "3": {
-                    "subtlety": 2,
-                    "confidence": 3,
-                    "obscuration": 3,
-                    "reason": "small nodule",
-                    "coordinates": "149.5, 251.0, 60.5"
-                }
-            }
-        }
-    ]
-    
     # Export to RA-D-PS format
-    output_folder = Path.home() / "Desktop"
+    # Records are streamed from the generator; only the first chunk_size
+    # are held in memory to size the radiologist blocks
+    output_folder = _DESKTOP
     exporter = RADPSExcelFormatter()
     
-    print(f"\n✅ Exporting {len(records)} records...")
+    print(f"\n✅ Exporting records...")
     print(f"📁 Output folder: {output_folder}")
     
-    output_path = exporter.export(records, output_folder)
+    output_path = exporter.export(_iter_sample_records(), output_folder, chunk_size=1000)
     
     print(f"\n✨ Export complete!")
     print(f"📄 File: {output_path.name}")
-    print(f"📊 Records: {len(records)}")
-    print(f"👥 Max radiologists: {max(len(r.get('radiologists', {})) for r in records)}")
+    # Counted while the rows were written, so the records are read only once
+    stats = exporter.last_export_stats
+    print(f"📊 Records: {stats.records}")
+    print(f"👥 Max radiologists: {stats.max_radiologists}")
     print(f"\n💡 Features:")
     print(f"   • Auto-named with timestamp")
     print(f"   • Dynamic radiologist blocks (1-3 in this example)")
@@ -90,55 +103,56 @@ def example_radps_export():
     return output_path
 
 
+# Sample template data
+_SAMPLE_TEMPLATE_DATA = [
+    {
+        'FileID': 'file001',
+        'NoduleID': 'N1',
+        'ParseCase': 'Complete_Attributes',
+        'SessionType': 'Standard',
+        'Radiologist 1': 'Conf:4 | Sub:3 | Obs:2',
+        'Radiologist 2': 'Conf:5 | Sub:4',
+        'Radiologist 3': '',
+        'Radiologist 4': '',
+        'SOP_UID': '1.2.840.1.12345',
+        'StudyInstanceUID': '1.2.840.113619.2.55',
+        'X_coord': '100.5',
+        'Y_coord': '200.3',
+        'Z_coord': '50.2',
+        'CoordCount': '3',
+    },
+    {
+        'FileID': 'file002',
+        'NoduleID': 'N2',
+        'ParseCase': 'Core_Attributes_Only',
+        'SessionType': 'Standard',
+        'Radiologist 1': 'Conf:3 | Sub:2',
+        'Radiologist 2': 'Conf:4 | Sub:3 | Obs:2',
+        'Radiologist 3': 'Conf:3 | Sub:2',
+        'Radiologist 4': '',
+        'SOP_UID': '1.2.840.1.54321',
+        'StudyInstanceUID': '1.2.840.113619.2.56',
+        'X_coord': '150.0',
+        'Y_coord': '250.5',
+        'Z_coord': '60.3',
+        'CoordCount': '3',
+    }
+]
+
+
 def example_template_export():
     """Example: Export data in template format"""
     print("\n\n📋 Template Excel Export Example")
     print("=" * 50)
     
-    # Sample template data
-    template_data = [
-        {
-            'FileID': 'file001',
-            'NoduleID': 'N1',
-            'ParseCase': 'Complete_Attributes',
-            'SessionType': 'Standard',
-            'Radiologist 1': 'Conf:4 | Sub:3 | Obs:2',
-            'Radiologist 2': 'Conf:5 | Sub:4',
-            'Radiologist 3': '',
-            'Radiologist 4': '',
-            'SOP_UID': '1.2.840.1.12345',
-            'StudyInstanceUID': '1.2.840.113619.2.55',
-            'X_coord': '100.5',
-            'Y_coord': '200.3',
-            'Z_coord': '50.2',
-            'CoordCount': '3',
-        },
-        {
-            'FileID': 'file002',
-            'NoduleID': 'N2',
-            'ParseCase': 'Core_Attributes_Only',
-            'SessionType': 'Standard',
-            'Radiologist 1': 'Conf:3 | Sub:2',
-            'Radiologist 2': 'Conf:4 | Sub:3 | Obs:2',
-            'Radiologist 3': 'Conf:3 | Sub:2',
-            'Radiologist 4': '',
-            'SOP_UID': '1.2.840.1.54321',
-            'StudyInstanceUID': '1.2.840.113619.2.56',
-            'X_coord': '150.0',
-            'Y_coord': '250.5',
-            'Z_coord': '60.3',
-            'CoordCount': '3',
-        }
-    ]
-    
     # Export to template format
-    output_path = Path.home() / "Desktop" / "radiology_template.xlsx"
+    output_path = _DESKTOP / "radiology_template.xlsx"
     exporter = TemplateExcelFormatter()
     
-    print(f"\n✅ Exporting {len(template_data)} records...")
+    print(f"\n✅ Exporting {len(_SAMPLE_TEMPLATE_DATA)} records...")
     print(f"📁 Output: {output_path}")
     
-    result_path = exporter.export(template_data, output_path)
+    result_path = exporter.export(_SAMPLE_TEMPLATE_DATA, output_path)
     
     print(f"\n✨ Export complete!")
     print(f"📄 File: {result_path.name}")
@@ -151,6 +165,19 @@ def example_template_export():
     return result_path
 
 
+_CUSTOM_STYLING_RECORDS = [
+    {
+        "file_number": "001",
+        "study_uid": "1.2.3.4.5",
+        "nodule_id": "N1",
+        "radiologists": {
+            "1": {"subtlety": 3, "confidence": 4, "obscuration": 2, 
+                  "reason": "test", "coordinates": "100, 200, 50"}
+        }
+    }
+]
+
+
 def example_custom_styling():
     """Example: Custom styling configuration"""
     print("\n\n🎨 Custom Styling Example")
@@ -162,20 +189,8 @@ def example_custom_styling():
         'light_blue_color': 'FFCCDDFF' # Custom light blue
     })
     
-    records = [
-        {
-            "file_number": "001",
-            "study_uid": "1.2.3.4.5",
-            "nodule_id": "N1",
-            "radiologists": {
-                "1": {"subtlety": 3, "confidence": 4, "obscuration": 2, 
-                      "reason": "test", "coordinates": "100, 200, 50"}
-            }
-        }
-    ]
-    
-    output_folder = Path.home() / "Desktop"
-    output_path = exporter.export(records, output_folder)
+    output_folder = _DESKTOP
+    output_path = exporter.export(_CUSTOM_STYLING_RECORDS, output_folder)
     
     print(f"✅ Exported with custom styling")
     print(f"📄 File: {output_path.name}")
@@ -184,30 +199,37 @@ def example_custom_styling():
     return output_path
 
 
+_TWO_RADIOLOGIST_RECORDS = [
+    {
+        "file_number": "001",
+        "study_uid": "1.2.3.4.5",
+        "nodule_id": "N1",
+        "radiologists": {
+            "1": {"subtlety": 3, "confidence": 4, "obscuration": 2,
+                  "reason": "", "coordinates": "100, 200, 50"},
+            "2": {"subtlety": 2, "confidence": 5, "obscuration": 1,
+                  "reason": "", "coordinates": "105, 205, 52"}
+        }
+    }
+]
+
+
+def _iter_two_radiologist_records():
+    """Yield sample records with only 2 radiologists"""
+    yield from _TWO_RADIOLOGIST_RECORDS
+
+
 def example_forced_radiologist_blocks():
     """Example: Force specific number of radiologist blocks"""
     print("\n\n🔢 Forced Radiologist Blocks Example")
     print("=" * 50)
     
-    # Data with only 2 radiologists
-    records = [
-        {
-            "file_number": "001",
-            "study_uid": "1.2.3.4.5",
-            "nodule_id": "N1",
-            "radiologists": {
-                "1": {"subtlety": 3, "confidence": 4, "obscuration": 2,
-                      "reason": "", "coordinates": "100, 200, 50"},
-                "2": {"subtlety": 2, "confidence": 5, "obscuration": 1,
-                      "reason": "", "coordinates": "105, 205, 52"}
-            }
-        }
-    ]
-    
-    # Force 4 radiologist columns (creates empty columns for R3, R4)
+    # Force 4 radiologist columns (creates empty columns for R3, R4);
+    # forced blocks also reserve room for records streamed after the first chunk
     exporter = RADPSExcelFormatter()
-    output_folder = Path.home() / "Desktop"
-    output_path = exporter.export(records, output_folder, force_blocks=4)
+    output_folder = _DESKTOP
+    output_path = exporter.export(_iter_two_radiologist_records(), output_folder,
+                                  force_blocks=4, chunk_size=1000)
     
     print(f"✅ Exported with forced 4 radiologist blocks")
     print(f"📄 File: {output_path.name}")
@@ -5,6 +5,8 @@ KeywordNormalizer Usage Examples
 Quick reference for medical keyword normalization in RA-D-PS.
 """
 
+import atexit
+import functools
 import sys
 from pathlib import Path
 
@@ -15,13 +17,29 @@ from src.ra_d_ps.keyword_normalizer import KeywordNormalizer
 from src.ra_d_ps.database.keyword_repository import KeywordRepository
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_normalizer() -> KeywordNormalizer:
+    """One dictionary-only normalizer shared by every example, closed at exit"""
+    normalizer = KeywordNormalizer()
+    atexit.register(normalizer.close)
+    return normalizer
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_repo() -> KeywordRepository:
+    """One database connection shared by every example, closed at exit"""
+    repo = KeywordRepository()
+    atexit.register(repo.close)
+    return repo
+
+
 def example_1_basic_normalization():
     """Example 1: Basic synonym and abbreviation normalization"""
     print("="*60)
     print("Example 1: Basic Normalization")
     print("="*60)
     
-    normalizer = KeywordNormalizer()
+    normalizer = _shared_normalizer()
     
     # Test various medical terms
     terms = [
@@ -30,11 +48,13 @@ def example_1_basic_normalization():
     ]
     
     print("\nNormalizing medical terms:")
+    
+    # Buffer the rows and write them in one call instead of a print per term
+    lines = []
     for term in terms:
         normalized = normalizer.normalize(term)
-        print(f"  {term:15} → {normalized}")
-    
-    normalizer.close()
+        lines.append(f"  {term:15} → {normalized}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def example_2_synonym_expansion():
@@ -43,7 +63,7 @@ def example_2_synonym_expansion():
     print("Example 2: Synonym Expansion for Search")
     print("="*60)
     
-    normalizer = KeywordNormalizer()
+    normalizer = _shared_normalizer()
     
     # Get all synonym forms
     search_terms = ["pulmonary", "nodule", "opacity"]
@@ -53,8 +73,6 @@ def example_2_synonym_expansion():
         forms = normalizer.get_all_forms(term)
         print(f"  {term}:")
         print(f"    → {', '.join(forms)}")
-    
-    normalizer.close()
 
 
 def example_3_multi_word_detection():
@@ -63,7 +81,7 @@ def example_3_multi_word_detection():
     print("Example 3: Multi-Word Term Detection")
     print("="*60)
     
-    normalizer = KeywordNormalizer()
+    normalizer = _shared_normalizer()
     
     # Sample radiology report text
     texts = [
@@ -79,8 +97,6 @@ def example_3_multi_word_detection():
         print(f"  Found {len(detected)} terms:")
         for term, start, end in detected:
             print(f"    - '{term}' at position {start}-{end}")
-    
-    normalizer.close()
 
 
 def example_4_stopword_filtering():
@@ -89,7 +105,7 @@ def example_4_stopword_filtering():
     print("Example 4: Stopword Filtering")
     print("="*60)
     
-    normalizer = KeywordNormalizer()
+    normalizer = _shared_normalizer()
     
     # Sample text with stopwords
     tokens = [
@@ -103,8 +119,6 @@ def example_4_stopword_filtering():
     
     print(f"Filtered: {' '.join(filtered)}")
     print(f"\nRemoved {len(tokens) - len(filtered)} stopwords")
-    
-    normalizer.close()
 
 
 def example_5_characteristic_normalization():
@@ -113,7 +127,7 @@ def example_5_characteristic_normalization():
     print("Example 5: LIDC Characteristic Normalization")
     print("="*60)
     
-    normalizer = KeywordNormalizer()
+    normalizer = _shared_normalizer()
     
     # LIDC characteristic values
     characteristics = [
@@ -127,12 +141,10 @@ def example_5_characteristic_normalization():
     print("\nNormalizing LIDC values:")
     for char, min_val, max_val in characteristics:
         print(f"\n  {char.upper()}:")
-        for val in ["1", "3", "5"]:
-            if int(val) <= int(max_val):
-                desc = normalizer.normalize_characteristic_value(char, val)
-                print(f"    {val} → {desc}")
-    
-    normalizer.close()
+        values = [val for val in ["1", "3", "5"] if int(val) <= int(max_val)]
+        descs = normalizer.normalize_characteristic_values(char, values)
+        for val, desc in zip(values, descs):
+            print(f"    {val} → {desc}")
 
 
 def example_6_anatomical_terms():
@@ -141,7 +153,7 @@ def example_6_anatomical_terms():
     print("Example 6: Anatomical Terms by Region")
     print("="*60)
     
-    normalizer = KeywordNormalizer()
+    normalizer = _shared_normalizer()
     
     # Get terms by anatomical region
     regions = ["lobes", "airways", "vasculature", "lymph_nodes"]
@@ -151,8 +163,6 @@ def example_6_anatomical_terms():
         terms = normalizer.get_anatomical_terms(region)
         print(f"\n  {region.upper()} ({len(terms)} terms):")
         print(f"    {', '.join(terms[:5])}...")
-    
-    normalizer.close()
 
 
 def example_7_diagnostic_terms():
@@ -161,7 +171,7 @@ def example_7_diagnostic_terms():
     print("Example 7: Diagnostic Terms by Category")
     print("="*60)
     
-    normalizer = KeywordNormalizer()
+    normalizer = _shared_normalizer()
     
     # Get terms by diagnostic category
     categories = ["benign", "malignant", "infectious", "inflammatory"]
@@ -171,8 +181,6 @@ def example_7_diagnostic_terms():
         terms = normalizer.get_diagnostic_terms(category)
         print(f"\n  {category.upper()} ({len(terms)} terms):")
         print(f"    {', '.join(terms[:5])}...")
-    
-    normalizer.close()
 
 
 def example_8_batch_processing():
@@ -181,7 +189,7 @@ def example_8_batch_processing():
     print("Example 8: Batch Normalization")
     print("="*60)
     
-    normalizer = KeywordNormalizer()
+    normalizer = _shared_normalizer()
     
     # Batch of keywords to normalize
     keywords = [
@@ -204,10 +212,11 @@ def example_8_batch_processing():
         canonical_groups.setdefault(canonical, []).append(orig)
     
     print("\nGrouped by canonical form:")
-    for canonical, originals in sorted(canonical_groups.items())[:5]:
-        print(f"  {canonical}: {', '.join(originals)}")
-    
-    normalizer.close()
+    lines = [
+        f"  {canonical}: {', '.join(originals)}"
+        for canonical, originals in sorted(canonical_groups.items())[:5]
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def example_9_database_integration():
@@ -217,9 +226,8 @@ def example_9_database_integration():
     print("="*60)
     
     try:
-        # Create normalizer with database connection
-        repo = KeywordRepository()
-        normalizer = KeywordNormalizer(keyword_repo=repo)
+        # Create normalizer with the shared database connection
+        normalizer = KeywordNormalizer(keyword_repo=_shared_repo())
         
         print("\n✓ Connected to database")
         print("  Normalizer will use database synonyms if available")
@@ -232,9 +240,6 @@ def example_9_database_integration():
             normalized = normalizer.normalize(term)
             print(f"  {term} → {normalized}")
         
-        normalizer.close()
-        repo.close()
-        
     except Exception as e:
         print(f"\n✗ Database connection failed: {e}")
         print("  Using dictionary-only normalization")
@@ -246,7 +251,7 @@ def example_10_quality_descriptors():
     print("Example 10: Quality Descriptors")
     print("="*60)
     
-    normalizer = KeywordNormalizer()
+    normalizer = _shared_normalizer()
     
     # Get quality descriptors
     categories = ["size", "shape", "density", "margin"]
@@ -256,8 +261,6 @@ def example_10_quality_descriptors():
         descriptors = normalizer.get_quality_descriptors(category)
         print(f"\n  {category.upper()} ({len(descriptors)} terms):")
         print(f"    {', '.join(descriptors[:5])}...")
-    
-    normalizer.close()
 
 
 if __name__ == '__main__':
@@ -150,6 +150,12 @@ def example_6_pagination():
     print("  # last page")
     print("  last_page_num = page1.total_results // page1.page_size + 1")
     print("  last_page = engine.search('nodule', page=last_page_num, page_size=20)")
+    print("  ")
+    print("Prepare once, page many times:")
+    print("  # parses, expands synonyms and ranks the query a single time")
+    print("  plan = engine.prepare('nodule')")
+    print("  p1 = plan.execute(page=1, page_size=20)")
+    print("  p2 = plan.execute(page=2, page_size=20)")
 
 
 def example_7_related_keywords():
@@ -118,7 +118,8 @@ def example_4_batch_processing():
     print("      pdf_paths=pdf_files,")
     print("      store_in_db=True,")
     print("      max_pages_per_pdf=20,")
-    print("      progress_callback=progress_callback")
+    print("      progress_callback=progress_callback,")
+    print("      max_workers=4  # pdfs are read in parallel worker processes")
     print("  )")
     print("  ")
     print("  # process results")
@@ -5,38 +5,62 @@ A comprehensive Python package for parsing, analyzing, and exporting
 radiology XML data from various medical imaging systems.
 """
 
-# Import from the main parser module
-from .parser import (
-    parse_radiology_sample,
-    parse_multiple,
-    export_excel,
-    convert_parsed_data_to_ra_d_ps_format,
-    open_file_cross_platform,
-    detect_parse_case,
-    get_expected_attributes_for_case
-)
-
-# Import GUI from separate module
-from .gui import NYTXMLGuiApp
-
-# Import database functionality
-try:
-    from .database import RadiologyDatabase
-except ImportError:
-    # Database might not be available in all environments
-    RadiologyDatabase = None
-
-# Import structure detection and batch processing
-try:
-    from .structure_detector import XMLStructureDetector, batch_detect_parse_cases
-    from .batch_processor import BatchProcessor, analyze_batch_structure, create_optimized_processing_plan
-except ImportError:
-    # Structure detection might not be available in all environments
-    XMLStructureDetector = None
-    BatchProcessor = None
-    batch_detect_parse_cases = None
-    analyze_batch_structure = None
-    create_optimized_processing_plan = None
+import importlib
+
+# Public names and the submodule each one lives in. They are imported on first
+# access (PEP 562) so that importing the package - e.g. for the CLI's --version -
+# does not pull in pandas, openpyxl, lxml or tkinter until something needs them.
+_LAZY_IMPORTS = {
+    # Main parser module
+    'parse_radiology_sample': '.parser',
+    'parse_multiple': '.parser',
+    'export_excel': '.parser',
+    'convert_parsed_data_to_ra_d_ps_format': '.parser',
+    'open_file_cross_platform': '.parser',
+    'detect_parse_case': '.parser',
+    'classify_files': '.parser',
+    'get_expected_attributes_for_case': '.parser',
+    # GUI from separate module
+    'NYTXMLGuiApp': '.gui',
+    # Database functionality
+    'RadiologyDatabase': '.database',
+    # Structure detection and batch processing
+    'XMLStructureDetector': '.structure_detector',
+    'batch_detect_parse_cases': '.structure_detector',
+    'BatchProcessor': '.batch_processor',
+    'analyze_batch_structure': '.batch_processor',
+    'create_optimized_processing_plan': '.batch_processor',
+}
+
+# Components that might not be available in all environments resolve to None
+_OPTIONAL = {
+    'RadiologyDatabase',
+    'XMLStructureDetector',
+    'batch_detect_parse_cases',
+    'BatchProcessor',
+    'analyze_batch_structure',
+    'create_optimized_processing_plan',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except (ImportError, AttributeError):
+        # A module can import yet lack the name, e.g. when the database/
+        # package shadows database.py
+        if name not in _OPTIONAL:
+            raise
+        value = None
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __version__ = "1.0.0"
 __author__ = "RA-D-PS Team"
@@ -51,6 +75,7 @@ __all__ = [
     'RadiologyDatabase',
     'open_file_cross_platform',
     'detect_parse_case',
+    'classify_files',
     'get_expected_attributes_for_case',
     'XMLStructureDetector',
     'BatchProcessor',
@@ -5,12 +5,13 @@ This module provides various export formats for processed radiology data,
 including Excel, SQLite, and other output formats.
 """
 
-from .excel_exporter import ExcelExporter, RADPSExcelFormatter
+from .excel_exporter import ExcelExporter, RADPSExcelFormatter, TemplateExcelFormatter
 from .base import BaseExporter, ExportError
 
 __all__ = [
     'ExcelExporter',
     'RADPSExcelFormatter',
+    'TemplateExcelFormatter',
     'BaseExporter',
     'ExportError',
 ]
@@ -12,25 +12,47 @@ Supports:
 - Cross-platform file opening
 """
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain, islice
 import re
 import pandas as pd
 
 try:
     from openpyxl import Workbook, load_workbook
-    from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
+    from openpyxl.styles import PatternFill, Font, Alignment, Border, Side, NamedStyle
+    from openpyxl.styles.borders import DEFAULT_BORDER
+    from openpyxl.styles.fonts import DEFAULT_FONT
     from openpyxl.utils import get_column_letter
     from openpyxl.formatting.rule import FormulaRule
+    from openpyxl.cell import WriteOnlyCell
     OPENPYXL_AVAILABLE = True
+    
+    # Header styles shared by every RA-D-PS export
+    _HEADER_FONT = Font(bold=True)
+    _HEADER_ALIGNMENT = Alignment(horizontal="center")
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
 from .base import BaseExporter, ExportError
 from ..schemas.canonical import RadiologyCanonicalDocument
 
 
+@lru_cache(maxsize=None)
+def _solid_fill(argb: str) -> "PatternFill":
+    """Solid fill for a color, shared by every exporter and cell using it."""
+    return PatternFill(start_color=argb, end_color=argb, fill_type="solid")
+
+
 class ExcelExporter(BaseExporter):
     """
     Base Excel exporter providing core functionality for all Excel exports.
@@ -85,8 +107,8 @@ class ExcelExporter(BaseExporter):
         white_argb = white_argb or self.white_argb
         blue_argb = blue_argb or self.light_blue_argb
         
-        white_fill = PatternFill(start_color=white_argb, end_color=white_argb, fill_type="solid")
-        blue_fill = PatternFill(start_color=blue_argb, end_color=blue_argb, fill_type="solid")
+        white_fill = _solid_fill(white_argb)
+        blue_fill = _solid_fill(blue_argb)
         
         max_row = ws.max_row
         for row_idx in range(data_start_row, max_row + 1):
@@ -105,6 +127,42 @@ class ExcelExporter(BaseExporter):
             min_width: Minimum column width
             max_width: Maximum column width
         """
+        # Longest value per column, from one row-wise pass over plain values
+        # instead of building every column's cell tuple
+        widths = self._max_value_lengths(ws.iter_rows(values_only=True))
+        self._set_column_widths(ws, cols, widths, min_width, max_width)
+    
+    def _max_value_lengths(self, rows) -> Dict[int, int]:
+        """
+        Find the longest string form of the values in each column.
+        
+        Args:
+            rows: Iterable of row value sequences
+            
+        Returns:
+            Dict mapping 1-based column index to its longest value length
+        """
+        widths = {}
+        for row in rows:
+            for col_idx, value in enumerate(row, start=1):
+                if value:
+                    length = len(str(value))
+                    if length > widths.get(col_idx, 0):
+                        widths[col_idx] = length
+        return widths
+    
+    def _set_column_widths(self, ws, cols: List[Optional[str]], widths: Dict[int, int],
+                           min_width: float = 12, max_width: float = 50):
+        """
+        Set column widths from header and longest value lengths.
+        
+        Args:
+            ws: Worksheet object (normal or write-only)
+            cols: Column headers (None for spacers)
+            widths: Longest value length per 1-based column index
+            min_width: Minimum column width
+            max_width: Maximum column width
+        """
         for col_idx, header in enumerate(cols, start=1):
             if header is None:  # Skip spacer columns
                 continue
@@ -113,12 +171,7 @@ class ExcelExporter(BaseExporter):
             column_letter = get_column_letter(col_idx)
             
             # Check data cells for max length
-            for cell in ws[column_letter]:
-                try:
-                    cell_length = len(str(cell.value)) if cell.value else 0
-                    max_length = max(max_length, cell_length)
-                except:
-                    pass
+            max_length = max(max_length, widths.get(col_idx, 0))
             
             # Set column width with constraints
             adjusted_width = min(max(max_length + 2, min_width), max_width)
@@ -135,8 +188,7 @@ class ExcelExporter(BaseExporter):
             blue_argb: Blue color code
             width: Width of spacer columns
         """
-        blue_argb = blue_argb or self.blue_argb
-        blue_fill = PatternFill(start_color=blue_argb, end_color=blue_argb, fill_type="solid")
+        blue_fill = _solid_fill(blue_argb or self.blue_argb)
         
         for col_idx, header in enumerate(cols, start=1):
             if header is None:  # Spacer column
@@ -148,6 +200,14 @@ class ExcelExporter(BaseExporter):
                     ws.cell(row=row_idx, column=col_idx).fill = blue_fill
 
 
+@dataclass
+class RADPSExportStats:
+    """Summary of the records written by the last RA-D-PS export."""
+    records: int
+    max_radiologists: int
+    radiologist_blocks: int
+
+
 class RADPSExcelFormatter(ExcelExporter):
     """
     RA-D-PS format Excel exporter with radiologist blocks and spacers.
@@ -161,17 +221,30 @@ class RADPSExcelFormatter(ExcelExporter):
     - Frozen header row
     """
     
-    def export(self, records: List[Dict], output_folder: Path, 
+    # Filled in by export(), in the same pass that writes the rows
+    last_export_stats: Optional[RADPSExportStats] = None
+    
+    def export(self, records: Iterable[Dict], output_folder: Path, 
                force_blocks: Optional[int] = None, 
-               sheet_name: str = "radiology_data") -> Path:
+               sheet_name: str = "radiology_data",
+               chunk_size: int = 10_000) -> Path:
         """
         Export records to RA-D-PS formatted Excel file.
         
+        Records are written in a single pass, so a generator can be streamed
+        without materializing it. Column widths are sized from the first
+        chunk_size records. For a list (or other sequence) every record is
+        scanned for the radiologist block count; for an iterator only the
+        first chunk_size records are, and a later record needing more blocks
+        raises ExportError, so pass force_blocks to reserve them up front.
+        Record and radiologist counts are left in last_export_stats.
+        
         Args:
-            records: List of record dicts with 'radiologists' nested structure
+            records: List or iterator of record dicts with 'radiologists' nested structure
             output_folder: Folder where Excel file will be saved
             force_blocks: Force specific number of radiologist blocks (optional)
             sheet_name: Name for the worksheet
+            chunk_size: Number of leading records scanned to size the columns
             
         Returns:
             Path to created Excel file
@@ -187,69 +260,80 @@ class RADPSExcelFormatter(ExcelExporter):
                 }
             }
         """
-        if not self.validate_data(records):
-            raise ExportError(f"Invalid data format. Expected list of dicts, got {type(records)}")
+        invalid = ExportError(f"Invalid data format. Expected list of dicts, got {type(records)}")
+        try:
+            records_iter = iter(records)
+        except TypeError:
+            raise invalid from None
+        
+        head = list(islice(records_iter, max(chunk_size, 1)))
+        if not self.validate_data(head):
+            raise invalid
         
-        if not records:
+        if not head:
             raise ExportError("No records to export")
         
-        # Determine maximum radiologist count
-        R_max = self._get_R_max(records, force_blocks)
+        # Determine maximum radiologist count; an iterator can only be
+        # scanned as far as the leading chunk
+        R_max = self._get_R_max(
+            records if isinstance(records, Sequence) else head, force_blocks
+        )
         
         # Build column structure
         cols = self._build_columns(R_max)
+        head_rows = [self._build_row(rec, R_max) for rec in head]
         
-        # Create workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = sheet_name[:31]  # Excel limit
-        
-        # Write headers
+        # Write-only workbook streams rows to disk instead of keeping every
+        # cell resident, so layout has to be set before the first append
+        wb = Workbook(write_only=True)
+        self._add_named_styles(wb)
+        ws = wb.create_sheet(title=sheet_name[:31])  # Excel limit
+        ws.freeze_panes = "A2"  # Freeze header row
+        self._set_column_widths(ws, cols, self._max_value_lengths(head_rows))
         for col_idx, header in enumerate(cols, start=1):
-            if header is not None:
-                cell = ws.cell(row=1, column=col_idx, value=header)
-                cell.font = Font(bold=True)
-                cell.alignment = Alignment(horizontal="center")
+            if header is None:  # Spacer column
+                ws.column_dimensions[get_column_letter(col_idx)].width = 2.0
         
-        # Write data rows
-        row_idx = 2
-        for rec in records:
-            # Fixed columns
-            ws.cell(row=row_idx, column=1, value=rec.get("file_number"))
-            ws.cell(row=row_idx, column=2, value=rec.get("study_uid"))
-            ws.cell(row=row_idx, column=4, value=rec.get("nodule_id"))
-            
-            # Radiologist blocks
-            radiologists = rec.get("radiologists", {})
-            if radiologists:
-                r_keys = sorted(radiologists.keys(), key=lambda x: int(x) if str(x).isdigit() else str(x))
-                R_this = len(r_keys)
+        # Write headers
+        header_row = []
+        for header in cols:
+            if header is None:
+                header_row.append(self._styled_cell(ws, None, "radps_spacer"))
             else:
-                R_this = int(rec.get("radiologist_count", 0))
-                r_keys = [str(i) for i in range(1, R_this + 1)]
-            
-            col_ptr = 6  # Start of first radiologist block
-            for r in range(1, R_max + 1):
-                if r <= R_this:
-                    r_key = r_keys[r - 1] if r <= len(r_keys) else str(r)
-                    rdict = radiologists.get(r_key, {})
-                    
-                    ws.cell(row=row_idx, column=col_ptr, value=rdict.get("subtlety"))
-                    ws.cell(row=row_idx, column=col_ptr + 1, value=rdict.get("confidence"))
-                    ws.cell(row=row_idx, column=col_ptr + 2, value=rdict.get("obscuration"))
-                    ws.cell(row=row_idx, column=col_ptr + 3, value=rdict.get("reason"))
-                    ws.cell(row=row_idx, column=col_ptr + 4, value=rdict.get("coordinates"))
-                
-                col_ptr += 6  # Move to next radiologist block
-            
-            row_idx += 1
-        
-        # Apply formatting
-        non_spacer_indices = self._get_non_spacer_indices(cols)
-        self._apply_row_striping(ws, non_spacer_indices)
-        ws.freeze_panes = "A2"  # Freeze header row
-        self._auto_size_columns(ws, cols)
-        self._fill_spacer_columns(ws, cols)
+                header_row.append(self._styled_cell(ws, header, "radps_header"))
+        ws.append(header_row)
+        
+        # Write data rows with alternating colors and solid spacer columns,
+        # streaming whatever follows the leading chunk
+        rows = chain(
+            zip(head, head_rows),
+            ((rec, self._build_row(rec, R_max)) for rec in records_iter)
+        )
+        R_seen = 0
+        try:
+            for row_num, (rec, values) in enumerate(rows):
+                R_this = self._radiologist_count(rec)
+                if R_this > R_max:
+                    raise ExportError(
+                        f"Record {row_num + 1} has {R_this} radiologists but only "
+                        f"{R_max} radiologist blocks were reserved from the first "
+                        f"{len(head)} records; pass force_blocks={R_this} or more"
+                    )
+                R_seen = max(R_seen, R_this)
+                style = "radps_row" if row_num % 2 == 0 else "radps_stripe"
+                ws.append([
+                    self._styled_cell(ws, value, "radps_spacer" if header is None else style)
+                    for header, value in zip(cols, values)
+                ])
+        except Exception:
+            self._discard_workbook(wb)
+            raise
+        
+        self.last_export_stats = RADPSExportStats(
+            records=row_num + 1,
+            max_radiologists=R_seen,
+            radiologist_blocks=R_max
+        )
         
         # Generate output path with auto-naming
         output_path = self._get_output_path(output_folder)
@@ -257,6 +341,79 @@ class RADPSExcelFormatter(ExcelExporter):
         
         return output_path
     
+    def _build_row(self, rec: Dict, R_max: int) -> List[Any]:
+        """
+        Flatten one record into cell values matching _build_columns(R_max).
+        
+        Args:
+            rec: Record dict
+            R_max: Number of radiologist blocks
+            
+        Returns:
+            List of cell values (None in spacer columns)
+        """
+        # Fixed columns
+        row = [rec.get("file_number"), rec.get("study_uid"), None, rec.get("nodule_id"), None]
+        
+        # Radiologist blocks
+        radiologists = rec.get("radiologists", {})
+        if radiologists:
+            r_keys = sorted(radiologists.keys(), key=lambda x: int(x) if str(x).isdigit() else str(x))
+            R_this = len(r_keys)
+        else:
+            R_this = int(rec.get("radiologist_count", 0))
+            r_keys = [str(i) for i in range(1, R_this + 1)]
+        
+        for r in range(1, R_max + 1):
+            if r <= R_this:
+                r_key = r_keys[r - 1] if r <= len(r_keys) else str(r)
+                rdict = radiologists.get(r_key, {})
+                row.extend([
+                    rdict.get("subtlety"),
+                    rdict.get("confidence"),
+                    rdict.get("obscuration"),
+                    rdict.get("reason"),
+                    rdict.get("coordinates"),
+                    None,
+                ])
+            else:
+                row.extend([None] * 6)
+        
+        return row
+    
+    def _add_named_styles(self, wb: "Workbook") -> None:
+        """
+        Register the header, spacer and row stripe styles on a workbook.
+        
+        Cells then pick up a style by name, which copies its precomputed
+        style indices instead of hashing font/fill/alignment objects per cell.
+        """
+        wb.add_named_style(NamedStyle(
+            "radps_header", font=_HEADER_FONT, border=DEFAULT_BORDER,
+            alignment=_HEADER_ALIGNMENT
+        ))
+        for name, argb in (("radps_spacer", self.blue_argb),
+                           ("radps_row", self.white_argb),
+                           ("radps_stripe", self.light_blue_argb)):
+            wb.add_named_style(NamedStyle(
+                name, font=DEFAULT_FONT, fill=_solid_fill(argb), border=DEFAULT_BORDER
+            ))
+    
+    @staticmethod
+    def _discard_workbook(wb: "Workbook") -> None:
+        """Close an unsaved write-only workbook and remove its temp sheet files."""
+        for ws in wb.worksheets:
+            if not ws.closed:
+                ws.close()
+            ws._writer.cleanup()
+    
+    @staticmethod
+    def _styled_cell(ws, value: Any, style: str):
+        """Create a write-only cell using a style registered by _add_named_styles."""
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        return cell
+    
     def validate_data(self, data: Any) -> bool:
         """Validate RA-D-PS format data."""
         if not isinstance(data, list):
@@ -287,29 +444,42 @@ class RADPSExcelFormatter(ExcelExporter):
         R_max = force_blocks or 0
         
         for rec in records:
-            cand = 0
-            
-            # Check radiologist_count field
-            if isinstance(rec.get("radiologist_count"), int):
-                cand = max(cand, rec["radiologist_count"])
-            
-            # Check radiologists dict
-            if isinstance(rec.get("radiologists"), dict):
-                cand = max(cand, len(rec["radiologists"]))
-            
-            # Check numbered radiologist fields
-            rad_nums = []
-            for key in rec.keys():
-                match = re.fullmatch(r"radiologist_(\d+)", str(key))
-                if match:
-                    rad_nums.append(int(match.group(1)))
-            if rad_nums:
-                cand = max(cand, max(rad_nums))
-            
-            R_max = max(R_max, cand)
+            R_max = max(R_max, self._radiologist_count(rec))
         
         return R_max if R_max > 0 else 1  # Minimum 1 radiologist
     
+    def _radiologist_count(self, rec: Dict) -> int:
+        """
+        Count the radiologists a single record carries.
+        
+        Args:
+            rec: Record dict
+            
+        Returns:
+            Largest of radiologist_count, the radiologists dict size and
+            the highest numbered radiologist_N field (0 if none)
+        """
+        cand = 0
+        
+        # Check radiologist_count field
+        if isinstance(rec.get("radiologist_count"), int):
+            cand = max(cand, rec["radiologist_count"])
+        
+        # Check radiologists dict
+        if isinstance(rec.get("radiologists"), dict):
+            cand = max(cand, len(rec["radiologists"]))
+        
+        # Check numbered radiologist fields
+        rad_nums = []
+        for key in rec.keys():
+            match = re.fullmatch(r"radiologist_(\d+)", str(key))
+            if match:
+                rad_nums.append(int(match.group(1)))
+        if rad_nums:
+            cand = max(cand, max(rad_nums))
+        
+        return cand
+    
     def _build_columns(self, R_max: int) -> List[Optional[str]]:
         """
         Build column structure with spacers.
@@ -372,10 +542,23 @@ class TemplateExcelFormatter(ExcelExporter):
         4: "F3E5F5"   # Light Purple
     }
     
+    # Template columns, in output order
+    HEADERS = (
+        'FileID', 'NoduleID', 'ParseCase', 'SessionType',
+        'Radiologist 1', 'Radiologist 2', 'Radiologist 3', 'Radiologist 4',
+        'SOP_UID', 'StudyInstanceUID', 'SeriesInstanceUID',
+        'X_coord', 'Y_coord', 'Z_coord', 'CoordCount',
+        'Modality', 'DateService', 'TimeService'
+    )
+    
     def export(self, template_data: List[Dict], output_path: Path) -> Path:
         """
         Export data in template format.
         
+        Written with xlsxwriter in constant-memory mode when it is installed
+        (pip install ra-d-ps[xlsx]), otherwise with openpyxl; both produce
+        the same layout and styling.
+        
         Args:
             template_data: List of dicts with template structure
             output_path: Full path including filename
@@ -386,53 +569,66 @@ class TemplateExcelFormatter(ExcelExporter):
         if not self.validate_data(template_data):
             raise ExportError(f"Invalid template data format")
         
+        output_path = self._next_versioned_path(Path(output_path))
+        
+        if XLSXWRITER_AVAILABLE:
+            self._export_with_xlsxwriter(template_data, output_path)
+        else:
+            self._export_with_openpyxl(template_data, output_path)
+        
+        return output_path
+    
+    def _cell_fill_color(self, col: int, header: str, value: Any) -> Optional[str]:
+        """
+        Pick the fill color (RGB hex) for a data cell, or None for no fill.
+        
+        Args:
+            col: 1-based column index
+            header: Column header
+            value: Cell value
+        """
+        # Highlight MISSING values
+        if str(value) == "MISSING":
+            return "FFE0B3"
+        
+        # Apply radiologist colors
+        if header.startswith('Radiologist '):
+            if col % 2 == 0 and value.strip():
+                return self.RAD_COLORS[int(header.split()[-1])]
+            return None
+        
+        # Alternating light gray for non-radiologist columns
+        return "F8F9FA" if col % 2 == 0 else None
+    
+    def _export_with_openpyxl(self, template_data: List[Dict], output_path: Path):
+        """Write the template workbook with openpyxl."""
         wb = Workbook()
         ws = wb.active
         ws.title = "Radiology Analysis"
+        headers = self.HEADERS
         
-        # Define headers
-        headers = [
-            'FileID', 'NoduleID', 'ParseCase', 'SessionType',
-            'Radiologist 1', 'Radiologist 2', 'Radiologist 3', 'Radiologist 4',
-            'SOP_UID', 'StudyInstanceUID', 'SeriesInstanceUID',
-            'X_coord', 'Y_coord', 'Z_coord', 'CoordCount',
-            'Modality', 'DateService', 'TimeService'
-        ]
+        # Style objects are built once and shared by every cell
+        center_alignment = Alignment(horizontal="center", vertical="center")
         
         # Write headers with styling
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = _solid_fill(self.blue_argb)
         for col, header in enumerate(headers, 1):
             cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color=self.blue_argb, 
-                                   end_color=self.blue_argb, fill_type="solid")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = center_alignment
         
         # Write data with color coding
         for row_num, data_row in enumerate(template_data, start=2):
             for col, header in enumerate(headers, 1):
                 cell = ws.cell(row=row_num, column=col)
                 cell.value = data_row.get(header, "")
-                cell.alignment = Alignment(horizontal="center", vertical="center")
+                cell.alignment = center_alignment
                 
-                # Apply radiologist colors
-                if header.startswith('Radiologist '):
-                    rad_num = int(header.split()[-1])
-                    if col % 2 == 0 and data_row.get(header, "").strip():
-                        cell.fill = PatternFill(
-                            start_color=self.RAD_COLORS[rad_num],
-                            end_color=self.RAD_COLORS[rad_num],
-                            fill_type="solid"
-                        )
-                else:
-                    # Alternating light gray for non-radiologist columns
-                    if col % 2 == 0:
-                        cell.fill = PatternFill(start_color="F8F9FA", 
-                                               end_color="F8F9FA", fill_type="solid")
-                
-                # Highlight MISSING values
-                if str(cell.value) == "MISSING":
-                    cell.fill = PatternFill(start_color="FFE0B3", 
-                                           end_color="FFE0B3", fill_type="solid")
+                fill_color = self._cell_fill_color(col, header, cell.value)
+                if fill_color:
+                    cell.fill = _solid_fill(fill_color)
         
         # Auto-fit columns
         self._auto_size_columns(ws, headers)
@@ -449,12 +645,55 @@ class TemplateExcelFormatter(ExcelExporter):
             for cell in row:
                 cell.border = thin_border
         
-        # Save
-        output_path = Path(output_path)
-        output_path = self._next_versioned_path(output_path)
         wb.save(output_path)
-        
-        return output_path
+    
+    def _export_with_xlsxwriter(self, template_data: List[Dict], output_path: Path):
+        """Write the template workbook with xlsxwriter, streaming rows in order."""
+        # constant_memory flushes each row once the next one starts, so rows
+        # are written strictly top to bottom; URLs stay plain text as with openpyxl
+        wb = xlsxwriter.Workbook(str(output_path), {
+            'constant_memory': True,
+            'strings_to_urls': False,
+            'use_zip64': True,
+        })
+        try:
+            ws = wb.add_worksheet("Radiology Analysis")
+            headers = self.HEADERS
+            
+            # One format per fill color, shared by every cell using it
+            base_format = {'align': 'center', 'valign': 'vcenter', 'border': 1}
+            formats = {None: wb.add_format(base_format)}
+            header_format = wb.add_format(dict(
+                base_format, bold=True, font_color='#FFFFFF',
+                bg_color='#' + self.blue_argb[-6:]
+            ))
+            
+            ws.write_row(0, 0, headers, header_format)
+            
+            # Write data with color coding, tracking column widths as we go
+            widths = {}
+            for row_num, data_row in enumerate(template_data, start=1):
+                for col, header in enumerate(headers, 1):
+                    value = data_row.get(header, "")
+                    fill_color = self._cell_fill_color(col, header, value)
+                    cell_format = formats.get(fill_color)
+                    if cell_format is None:
+                        cell_format = formats[fill_color] = wb.add_format(
+                            dict(base_format, bg_color='#' + fill_color)
+                        )
+                    ws.write(row_num, col - 1, value, cell_format)
+                    
+                    if value:
+                        length = len(str(value))
+                        if length > widths.get(col, 0):
+                            widths[col] = length
+            
+            # Auto-fit columns (same limits as _auto_size_columns)
+            for col, header in enumerate(headers, 1):
+                max_length = max(len(header), widths.get(col, 0))
+                ws.set_column(col - 1, col - 1, min(max(max_length + 2, 12), 50))
+        finally:
+            wb.close()
     
     def validate_data(self, data: Any) -> bool:
         """Validate template format data."""
@@ -463,4 +702,4 @@ class TemplateExcelFormatter(ExcelExporter):
         )
 
 
-__all__ = ['ExcelExporter', 'RADPSExcelFormatter', 'TemplateExcelFormatter']
+__all__ = ['ExcelExporter', 'RADPSExcelFormatter', 'RADPSExportStats', 'TemplateExcelFormatter']
@@ -10,6 +10,9 @@ Dictionary: data/medical_terms.json
 
 import json
 import logging
+import re
+import sys
+from functools import lru_cache
 from typing import List, Dict, Set, Optional, Tuple
 from pathlib import Path
 
@@ -19,6 +22,9 @@ from .database.keyword_repository import KeywordRepository
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Maximal run of alphanumeric characters (same test as str.isalnum)
+_WORD_RUN = re.compile(r'[^\W_]+')
+
 
 class KeywordNormalizer:
     """
@@ -43,6 +49,9 @@ class KeywordNormalizer:
             medical_terms_path: Path to medical_terms.json (default: data/medical_terms.json)
             keyword_repo: KeywordRepository instance (optional, for database synonym lookups)
         """
+        # Memoized dictionary lookups; database synonyms are always looked up
+        # fresh so ones added after startup are seen
+        self._normalize_from_maps = lru_cache(maxsize=65536)(self._normalize_from_maps_uncached)
         self.repo = keyword_repo
         
         # Load medical terms dictionary
@@ -95,17 +104,22 @@ class KeywordNormalizer:
         - synonym_map: term → canonical_form
         - abbreviation_map: abbr → full_form
         - multi_word_set: set of multi-word terms
+        - multi_word_index: first word → multi-word terms (longest first)
+        - characteristic_map: characteristic → value → first descriptor
         """
         # Build synonym map (bidirectional)
         self.synonym_map = {}
         
         for canonical, synonyms in self.medical_terms.get('synonyms', {}).items():
+            # Canonical forms are interned so every normalized result shares them
+            canonical = sys.intern(canonical.lower())
+            
             # Map canonical to itself
-            self.synonym_map[canonical.lower()] = canonical.lower()
+            self.synonym_map[canonical] = canonical
             
             # Map each synonym to canonical
             for syn in synonyms:
-                self.synonym_map[syn.lower()] = canonical.lower()
+                self.synonym_map[syn.lower()] = canonical
         
         # Build abbreviation map
         self.abbreviation_map = {
@@ -118,8 +132,35 @@ class KeywordNormalizer:
             term.lower() for term in self.medical_terms.get('multi_word_terms', [])
         )
         
+        # Index multi-word terms by their leading word so detection only tries
+        # the terms that can start at each word of the text; terms that don't
+        # start with a word character are scanned for separately
+        self.multi_word_index = {}
+        self._multi_word_unindexed = []
+        for term in sorted(self.multi_word_set, key=len, reverse=True):
+            first = _WORD_RUN.match(term)
+            if first:
+                self.multi_word_index.setdefault(first.group(), []).append(term)
+            else:
+                self._multi_word_unindexed.append(term)
+        
+        # Matches only whole words of the text that lead some multi-word term
+        leading_words = sorted(self.multi_word_index, key=len, reverse=True)
+        self._multi_word_leads = re.compile(
+            r'(?<![^\W_])(?:' + '|'.join(map(re.escape, leading_words)) + r')(?![^\W_])'
+        ) if leading_words else None
+        
+        # Build LIDC characteristic value map (first descriptor per value)
+        self.characteristic_map = {
+            characteristic: {
+                value: descriptors[0]
+                for value, descriptors in value_map.items() if descriptors
+            }
+            for characteristic, value_map in self.medical_terms.get('characteristic_values', {}).items()
+        }
+        
         # Get stopwords
-        self.stopwords = set(
+        self.stopwords = frozenset(
             word.lower() for word in self.medical_terms.get('stopwords', [])
         )
         
@@ -143,25 +184,38 @@ class KeywordNormalizer:
             normalize("CT") → "computed tomography"
             normalize("GGO") → "ground glass opacity"
         """
-        keyword_lower = keyword.lower().strip()
-        
-        # Step 1: Check if it's an abbreviation
-        if expand_abbreviations and keyword_lower in self.abbreviation_map:
-            keyword_lower = self.abbreviation_map[keyword_lower]
-        
-        # Step 2: Check if it's a synonym
-        if keyword_lower in self.synonym_map:
-            return self.synonym_map[keyword_lower]
+        keyword_lower, mapped = self._normalize_from_maps(
+            keyword.lower().strip(), expand_abbreviations
+        )
+        if mapped:
+            return keyword_lower
         
         # Step 3: Check database for stored synonyms (if repo available)
         if self.repo:
             canonical = self.repo.get_canonical_keyword(keyword_lower)
             if canonical:
-                return canonical.keyword_text.lower()
+                return sys.intern(canonical.keyword_text.lower())
         
         # Step 4: Return original (lowercased) if no mapping found
         return keyword_lower
     
+    def _normalize_from_maps_uncached(self, keyword_lower: str,
+                                      expand_abbreviations: bool) -> Tuple[str, bool]:
+        """
+        Apply the dictionary steps of normalize to a lowercased, stripped keyword.
+        
+        Returns the interned result and whether the synonym map matched it.
+        """
+        # Step 1: Check if it's an abbreviation
+        if expand_abbreviations and keyword_lower in self.abbreviation_map:
+            keyword_lower = self.abbreviation_map[keyword_lower]
+        
+        # Step 2: Check if it's a synonym
+        if keyword_lower in self.synonym_map:
+            return self.synonym_map[keyword_lower], True
+        
+        return sys.intern(keyword_lower), False
+    
     def get_all_forms(self, keyword: str) -> List[str]:
         """
         Get all synonym forms of a keyword (for search expansion).
@@ -240,10 +294,22 @@ class KeywordNormalizer:
         text_lower = text.lower()
         detected = []
         
-        # Sort multi-word terms by length (longest first) to prioritize longer matches
-        sorted_terms = sorted(self.multi_word_set, key=len, reverse=True)
-        
-        for term in sorted_terms:
+        # A term can only match where its leading word is a word of the text,
+        # so one scan for those words checks just the candidate terms there
+        # (longest first to prioritize longer matches)
+        words = self._multi_word_leads.finditer(text_lower) if self._multi_word_leads else ()
+        for word in words:
+            pos = word.start()
+            for term in self.multi_word_index[word.group()]:
+                end = pos + len(term)
+                if text_lower.startswith(term, pos) and (
+                        end == len(text_lower) or not text_lower[end].isalnum()):
+                    detected.append((term, pos, end))
+        
+        if not self._multi_word_unindexed:
+            return detected
+        
+        for term in self._multi_word_unindexed:
             start = 0
             while True:
                 pos = text_lower.find(term, start)
@@ -259,8 +325,8 @@ class KeywordNormalizer:
                 
                 start = pos + 1
         
-        # Sort by position
-        detected.sort(key=lambda x: x[1])
+        # Sort by position, longer matches first
+        detected.sort(key=lambda x: (x[1], -len(x[0])))
         
         return detected
     
@@ -279,19 +345,32 @@ class KeywordNormalizer:
             normalize_characteristic_value("subtlety", "5") → "obvious"
             normalize_characteristic_value("malignancy", "1") → "highly unlikely malignant"
         """
-        char_values = self.medical_terms.get('characteristic_values', {})
+        value_map = self.characteristic_map.get(characteristic.lower())
         
-        if characteristic.lower() not in char_values:
+        if value_map is None:
             return value  # Return original if not found
         
-        value_map = char_values[characteristic.lower()]
+        # First descriptor for this value, or the original if not found
+        return value_map.get(value, value)
+    
+    def normalize_characteristic_values(self, characteristic: str,
+                                        values: List[str]) -> List[str]:
+        """
+        Normalize a batch of values for one LIDC characteristic.
         
-        if value not in value_map:
-            return value  # Return original if not found
+        Args:
+            characteristic: Characteristic name (e.g., 'subtlety', 'malignancy')
+            values: Numeric or text values
+            
+        Returns:
+            Normalized descriptive text for each value, in order
+        """
+        value_map = self.characteristic_map.get(characteristic.lower())
+        
+        if value_map is None:
+            return list(values)
         
-        # Return first descriptor for this value
-        descriptors = value_map[value]
-        return descriptors[0] if descriptors else value
+        return [value_map.get(value, value) for value in values]
     
     def get_anatomical_terms(self, region: str = None) -> List[str]:
         """
@@ -381,7 +460,9 @@ class KeywordNormalizer:
         Returns:
             Filtered list (stopwords removed)
         """
-        return [token for token in tokens if not self.is_stopword(token)]
+        # Same test as is_stopword, without a method call per token
+        stopwords = self.stopwords
+        return [token for token in tokens if token.lower() not in stopwords]
     
     def normalize_batch(self, keywords: List[str], 
                        expand_abbreviations: bool = True) -> Dict[str, str]:
@@ -395,9 +476,10 @@ class KeywordNormalizer:
         Returns:
             Dictionary mapping original → normalized
         """
+        # Each distinct keyword is normalized once, in first-seen order
         return {
             kw: self.normalize(kw, expand_abbreviations)
-            for kw in keywords
+            for kw in dict.fromkeys(keywords)
         }
     
     def get_quality_descriptors(self, category: str = None) -> List[str]:
@@ -428,5 +510,6 @@ class KeywordNormalizer:
     
     def close(self):
         """Close database connection (if repo was provided)"""
+        self._normalize_from_maps.cache_clear()
         if self.repo:
             self.repo.close()
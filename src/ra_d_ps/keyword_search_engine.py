@@ -15,6 +15,7 @@ KeywordNormalizer for query expansion.
 
 import re
 import math
+import time
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Set, Tuple
 from collections import defaultdict
@@ -50,6 +51,48 @@ class SearchResponse:
     search_time_ms: float = 0.0
 
 
+@dataclass
+class QueryPlan:
+    """
+    prepared search: parsed, synonym-expanded and ranked once.
+    
+    pages are sliced from the ranked results, so paging through a query
+    does not repeat query parsing, synonym expansion or scoring. results
+    reflect the corpus at the time the plan was prepared.
+    """
+    query: str
+    expanded_query_terms: List[str] = field(default_factory=list)
+    ranked_results: List[SearchResult] = field(default_factory=list)
+    prepare_time_ms: float = 0.0
+    
+    def execute(self, page: int = 1, page_size: int = 20) -> SearchResponse:
+        """
+        get one page of the prepared results.
+        
+        args:
+            page: page number (1-indexed)
+            page_size: results per page
+            
+        returns:
+            search response for the requested page; search_time_ms is the
+            time spent in this call (prepare_time_ms is reported separately)
+        """
+        start_time = time.time()
+        start_idx = (page - 1) * page_size
+        end_idx = start_idx + page_size
+        results = self.ranked_results[start_idx:end_idx]
+        
+        return SearchResponse(
+            query=self.query,
+            total_results=len(self.ranked_results),
+            page=page,
+            page_size=page_size,
+            results=results,
+            expanded_query_terms=self.expanded_query_terms,
+            search_time_ms=round((time.time() - start_time) * 1000, 2)
+        )
+
+
 class QueryParser:
     """parse boolean search queries with AND/OR operators."""
     
@@ -141,7 +184,35 @@ class KeywordSearchEngine:
         returns:
             search response with results and metadata
         """
-        import time
+        plan = self.prepare(
+            query,
+            categories=categories,
+            min_relevance=min_relevance,
+            expand_synonyms=expand_synonyms
+        )
+        response = plan.execute(page=page, page_size=page_size)
+        response.search_time_ms = round(plan.prepare_time_ms + response.search_time_ms, 2)
+        return response
+    
+    def prepare(
+        self,
+        query: str,
+        categories: Optional[List[str]] = None,
+        min_relevance: float = 0.0,
+        expand_synonyms: bool = True
+    ) -> QueryPlan:
+        """
+        parse, expand and rank a query once for repeated page requests.
+        
+        args:
+            query: search query string (supports AND/OR operators)
+            categories: optional category filter (e.g., ['abstract', 'body'])
+            min_relevance: minimum relevance score threshold
+            expand_synonyms: whether to expand query terms with synonyms
+            
+        returns:
+            query plan whose execute(page, page_size) returns search responses
+        """
         start_time = time.time()
         
         # parse query
@@ -222,23 +293,14 @@ class KeywordSearchEngine:
         # sort by relevance (descending)
         scored_results.sort(key=lambda r: r.relevance_score, reverse=True)
         
-        # paginate
-        total_results = len(scored_results)
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        page_results = scored_results[start_idx:end_idx]
-        
         # calculate search time
         search_time = (time.time() - start_time) * 1000  # convert to ms
         
-        return SearchResponse(
+        return QueryPlan(
             query=query,
-            total_results=total_results,
-            page=page,
-            page_size=page_size,
-            results=page_results,
             expanded_query_terms=sorted(expanded_terms),
-            search_time_ms=round(search_time, 2)
+            ranked_results=scored_results,
+            prepare_time_ms=round(search_time, 2)
         )
     
     def _matches_query(
@@ -265,13 +327,11 @@ class KeywordSearchEngine:
         
         matched_terms = set()
         
-        # check each query term
+        # check each query term (substring match also covers whole words of
+        # multi-word keywords, so no separate word split is needed)
         for term in query_terms:
             if term in keyword_lower or term in normalized_lower:
                 matched_terms.add(term)
-            # check if term is substring (for multi-word matching)
-            elif term in keyword_lower.split() or term in normalized_lower.split():
-                matched_terms.add(term)
         
         # apply operator logic
         if operator == 'AND':
@@ -1,18 +1,21 @@
 ## draft 2
 
 # import necessary libraries for data handling, xml parsing, os operations, and gui
+import atexit
 import datetime
 import gc
+import logging
 import os
 import pandas as pd
 import platform
 import re
+import shelve
 import subprocess
+import sys
 import traceback
-import xml.etree.ElementTree as ET
 from collections import defaultdict
-import tkinter as tk
-from tkinter import filedialog, messagebox
+from concurrent.futures import ProcessPoolExecutor
+from lxml import etree
 from openpyxl.utils import get_column_letter
 from openpyxl.styles import PatternFill, Font, Alignment
 from openpyxl import Workbook
@@ -20,6 +23,8 @@ from openpyxl.formatting.rule import FormulaRule
 from openpyxl.styles.differential import DifferentialStyle
 from openpyxl.formatting.rule import Rule
 
+logger = logging.getLogger(__name__)
+
 # Import the database module
 try:
     from radiology_database import RadiologyDatabase
@@ -46,9 +51,39 @@ def open_file_cross_platform(file_path):
 
 # -------- RA-D-PS Excel Exporter --------
 
+_UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_\-]+")
+
+def _namespace_uri(tag: str) -> str:
+    """Namespace URI from a "{uri}tag" element tag ('' when not namespaced)."""
+    return tag[1:tag.index('}')] if tag.startswith('{') else ''
+
+# Optional on-disk cache of detect_parse_case results keyed by path, size and
+# mtime, so unchanged files are not re-parsed on the next run. Off (in-memory
+# only) unless RA_D_PS_PARSE_CASE_CACHE or set_parse_case_cache() names a file.
+PARSE_CASE_CACHE_PATH = os.environ.get("RA_D_PS_PARSE_CASE_CACHE") or None
+# Bump whenever the classification rules change so stale entries are ignored
+_PARSE_CASE_CACHE_VERSION = 1
+_parse_case_cache = None
+
+# Local names detect_parse_case looks up, qualified once per file
+_DETECT_TAG_NAMES = (
+    'ResponseHeader', 'Modality', 'readingSession', 'CXRreadingSession',
+    'unblindedReadNodule', 'unblindedRead', 'characteristics',
+    'confidence', 'subtlety', 'obscuration', 'reason',
+)
+
+# Every tag parse_radiology_sample looks up, qualified once per file
+_SAMPLE_TAG_NAMES = (
+    'ResponseHeader', 'StudyInstanceUID', 'SeriesInstanceUID', 'SeriesInstanceUid',
+    'Modality', 'DateService', 'TimeService', 'readingSession', 'CXRreadingSession',
+    'servicingRadiologistID', 'unblindedReadNodule', 'unblindedRead', 'noduleID',
+    'characteristics', 'confidence', 'subtlety', 'obscuration', 'reason', 'roi',
+    'imageSOP_UID', 'edgeMap', 'xCoord', 'yCoord', 'imageZposition',
+)
+
 def _sanitize_name(name: str) -> str:
     """Keep A-Z a-z 0-9 _ -, replace others with underscore."""
-    return re.sub(r"[^A-Za-z0-9_\-]+", "_", name.strip())
+    return _UNSAFE_NAME_RE.sub("_", name.strip())
 
 def _timestamp() -> str:
     """Return local timestamp YYYY-MM-DD_HHMMSS."""
@@ -130,18 +165,22 @@ def _apply_row_striping(ws, non_spacer_indices: list, blue_argb: str = "FFCCE5FF
 
 def _auto_size_columns(ws, cols: list):
     """Auto-size all columns based on max cell length; keep spacers narrow."""
+    # One row-wise pass over plain values instead of building every column's cell tuple
+    widths = {}
+    for row in ws.iter_rows(values_only=True):
+        for i, v in enumerate(row, start=1):
+            if v is not None:
+                length = len(str(v))
+                if length > widths.get(i, 0):
+                    widths[i] = length
     for i, header in enumerate(cols, start=1):
         col_letter = get_column_letter(i)
         if header is None:
             ws.column_dimensions[col_letter].width = 3  # spacer stays thin
             continue
-        max_len = 0
+        max_len = widths.get(i, 0)
         if header:
             max_len = max(max_len, len(str(header)))
-        for cell in ws[col_letter]:
-            v = cell.value
-            if v is not None:
-                max_len = max(max_len, len(str(v)))
         ws.column_dimensions[col_letter].width = max(10, min(max_len + 2, 60))
 
 def _fill_spacer_columns(ws, cols, blue_argb="FFCCE5FF"):
@@ -319,7 +358,8 @@ def convert_parsed_data_to_ra_d_ps_format(dataframes):
             # Build radiologists dictionary
             print(f"      👥 Building radiologists dictionary...")
             radiologists = {}
-            for idx, row in group.iterrows():
+            # Plain dicts per row: no Series is built for each radiologist
+            for idx, row in zip(group.index, group.to_dict('records')):
                 radiologist = row.get('Radiologist', f'rad_{idx+1}')
                 print(f"        👨‍⚕️ Processing radiologist: {radiologist}")
                 
@@ -432,157 +472,98 @@ def parse_radiology_sample(file_path):
     """
     parse a single radiology xml file and extract nodule/roi data
     
+    the file is streamed with lxml iterparse: each reading session is turned
+    into rows as soon as its end tag is seen and is then cleared, so memory
+    stays around one session rather than the whole document tree.
+    
     args:
         file_path: path to the xml file to parse
     
     returns:
         tuple: (main_dataframe, unblinded_dataframe) containing extracted data
     """
-    print(f"🔍 Parsing XML file: {os.path.basename(file_path)}")
+    # Progress lines are collected and written with one stdout call per file,
+    # instead of a print (and a flush on a terminal) per session, read and ROI
+    lines = []
+    try:
+        return _parse_radiology_sample(file_path, lines.append)
+    finally:
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _parse_radiology_sample(file_path, emit):
+    """parse_radiology_sample body; progress lines go to emit instead of print"""
+    emit(f"🔍 Parsing XML file: {os.path.basename(file_path)}")
     
     # detect the parse case first to understand xml structure
-    print(f"  📋 Detecting parse case...")
+    emit(f"  📋 Detecting parse case...")
     parse_case = detect_parse_case(file_path)
-    print(f"  ✅ Parse case: {parse_case}")
+    emit(f"  ✅ Parse case: {parse_case}")
     
     expected_attrs = get_expected_attributes_for_case(parse_case)
     
-    # re already imported at module level
     file_id = os.path.basename(file_path).split('.')[0]
-    print(f"  📄 File ID: {file_id}")
-    
-    print(f"  🔄 Loading XML structure...")
-    tree = ET.parse(file_path)
-    xml_root = tree.getroot()
-    print(f"  ✅ XML loaded, root element: {root.tag.split('}')[-1] if '}' in root.tag else root.tag}")
+    emit(f"  📄 File ID: {file_id}")
     
     # Debug logging for N/A diagnosis
     debug_info = []
 
-    # Dynamically get the namespace from the root tag
-    m = re.match(r'\{(.*)\}', root.tag)
-    ns_uri = m.group(1) if m else ''
-    
-    # Helper to build tag with or without namespace
-    def tag(name):
-        return f"{{{ns_uri}}}{name}" if ns_uri else name
-
-    # Detect XML structure based on root element
-    root_tag_name = root.tag.split('}')[-1] if '}' in root.tag else root.tag
-    is_lidc_format = root_tag_name == 'LidcReadMessage'
-    
-    # Extract header information with expected vs missing logic
-    print(f"  🔍 Extracting header information...")
-    header = root.find(tag('ResponseHeader'))
-    header_values = {}
-    
-    if header is not None:
-        print(f"  ✅ ResponseHeader found")
-        debug_info.append("✓ ResponseHeader found")
-        
-        # Check each expected header field
-        for field in ["StudyInstanceUID", "SeriesInstanceUID", "SeriesInstanceUid", "Modality", "DateService", "TimeService"]:
-            if field == "SeriesInstanceUID":
-                # Handle different spelling variations
-                elem = header.find(tag('SeriesInstanceUID')) or header.find(tag('SeriesInstanceUid'))
-                field_key = "SeriesInstanceUID"
-            else:
-                elem = header.find(tag(field))
-                field_key = field
-            
-            if elem is not None and elem.text:
-                header_values[field_key] = elem.text
-            elif field_key in expected_attrs["header"]:
-                header_values[field_key] = "MISSING"
-                debug_info.append(f"⚠️  {field_key} expected but MISSING")
-            else:
-                header_values[field_key] = "#N/A"
-    else:
-        print(f"  ⚠️  ResponseHeader NOT FOUND")
-        debug_info.append("❌ ResponseHeader NOT FOUND")
-        # Set all header fields based on expectations
-        for field in ["StudyInstanceUID", "SeriesInstanceUID", "Modality", "DateService", "TimeService"]:
-            if field in expected_attrs["header"]:
-                header_values[field] = "MISSING"
-            else:
-                header_values[field] = "#N/A"
-    
-    # Extract values with defaults
-    study_uid = header_values.get("StudyInstanceUID", "#N/A")
-    series_uid = header_values.get("SeriesInstanceUID", "#N/A") 
-    modality = header_values.get("Modality", "#N/A")
-    date_service = header_values.get("DateService", "#N/A")
-    time_service = header_values.get("TimeService", "#N/A")
-    print(f"  📊 Header extracted: StudyUID={study_uid[:20]}...{'(truncated)' if len(study_uid) > 20 else ''}")
+    # Namespace and format are taken from the root element once it is known
+    xml_root = None
+    ns_uri = ''
+    session_tag = unblinded_tag = None
 
-    data_rows = []
-    unblinded_data_rows = []
+    # Namespace-qualified tags, built once the root is known
+    tags = {}
 
-    # Determine session element name based on format
-    session_tag = 'readingSession' if is_lidc_format else 'CXRreadingSession'
-    unblinded_tag = 'unblindedReadNodule' if is_lidc_format else 'unblindedRead'
+    def init_root(root_elem):
+        nonlocal xml_root, ns_uri, session_tag, unblinded_tag
+        xml_root = root_elem
+        # Dynamically get the namespace from the root tag
+        ns_uri = _namespace_uri(xml_root.tag)
+        tags.update((name, f"{{{ns_uri}}}{name}" if ns_uri else name) for name in _SAMPLE_TAG_NAMES)
+        # Detect XML structure based on root element
+        root_tag_name = xml_root.tag.split('}')[-1] if '}' in xml_root.tag else xml_root.tag
+        is_lidc_format = root_tag_name == 'LidcReadMessage'
+        # Determine session element name based on format
+        session_tag = 'readingSession' if is_lidc_format else 'CXRreadingSession'
+        unblinded_tag = 'unblindedReadNodule' if is_lidc_format else 'unblindedRead'
+        emit(f"  ✅ XML opened, root element: {root_tag_name}")
 
-    # Look for session elements
-    print(f"  🔍 Looking for reading sessions...")
-    sessions = root.findall(tag(session_tag))
-    print(f"  📊 Found {len(sessions)} sessions (searching for {session_tag})")
-    debug_info.append(f"Sessions found: {len(sessions)} (looking for {session_tag})")
-    
-    if not sessions:
-        print(f"  ⚠️  No sessions found - trying alternative session tags")
-        debug_info.append(f"❌ NO SESSIONS FOUND - trying alternative session tags")
-        # Try alternative session tags
-        alt_sessions = root.findall(tag('readingSession')) + root.findall(tag('CXRreadingSession'))
-        print(f"  📊 Alternative sessions found: {len(alt_sessions)}")
-        debug_info.append(f"Alternative sessions: {len(alt_sessions)}")
-        if alt_sessions:
-            sessions = alt_sessions
-            print(f"  ✅ Using alternative sessions")
-            debug_info.append("✓ Using alternative sessions")
-    
-    # Print debug info for files with issues
-    if not sessions or any("❌" in info for info in debug_info):
-        print(f"\nDEBUG INFO for {file_id}:")
-        for info in debug_info:
-            print(f"  {info}")
-        if not sessions:
-            print(f"  Root children: {[child.tag for child in root]}")
-    
-    print(f"  🔄 Processing {len(sessions)} sessions...")
-    for session_idx, session in enumerate(sessions):
-        print(f"    📋 Session {session_idx + 1}/{len(sessions)}")
+    def parse_session(session, session_idx):
+        """turn one reading session element into row dicts (header columns are added later)"""
+        session_rows = []
+        emit(f"    📋 Session {session_idx + 1}")
         
-        rad_base_elem = session.find(tag('servicingRadiologistID'))
+        rad_base_elem = session.find(tags['servicingRadiologistID'])
         rad_base = rad_base_elem.text if rad_base_elem is not None else "unknown"
         
         # Use session index + 1 for consistent radiologist numbering
         radiologist = f"anonRad{session_idx + 1}"
-        print(f"      👨‍⚕️ Radiologist: {radiologist} (base: {rad_base})")
-        
-        # Check if this is the last radiologist (unblinded read)
-        is_last_radiologist = session_idx == len(sessions) - 1
+        emit(f"      👨‍⚕️ Radiologist: {radiologist} (base: {rad_base})")
 
         # Look for unblinded read elements
-        unblinded_reads = session.findall(tag(unblinded_tag))
-        print(f"      📊 Found {len(unblinded_reads)} unblinded reads")
+        unblinded_reads = session.findall(tags[unblinded_tag])
+        emit(f"      📊 Found {len(unblinded_reads)} unblinded reads")
         
         for unblinded_idx, unblinded in enumerate(unblinded_reads):
-            print(f"        🔍 Processing unblinded read {unblinded_idx + 1}/{len(unblinded_reads)}")
+            emit(f"        🔍 Processing unblinded read {unblinded_idx + 1}/{len(unblinded_reads)}")
             
-            nodule_id_elem = unblinded.find(tag('noduleID'))
+            nodule_id_elem = unblinded.find(tags['noduleID'])
             nodule_id = nodule_id_elem.text if nodule_id_elem is not None else "#N/A"
-            print(f"          📌 Nodule ID: {nodule_id}")
+            emit(f"          📌 Nodule ID: {nodule_id}")
             
             # Parse characteristics with expected vs missing logic
-            print(f"          🔍 Extracting characteristics...")
-            characteristics = unblinded.find(tag('characteristics'))
+            emit(f"          🔍 Extracting characteristics...")
+            characteristics = unblinded.find(tags['characteristics'])
             char_values = {}
             
             if characteristics is not None:
-                print(f"          ✅ Characteristics found")
+                emit(f"          ✅ Characteristics found")
                 # Check each characteristic field
                 for char_field in ["confidence", "subtlety", "obscuration", "reason"]:
-                    elem = characteristics.find(tag(char_field))
+                    elem = characteristics.find(tags[char_field])
                     if elem is not None and elem.text:
                         char_values[char_field] = elem.text
                     elif char_field in expected_attrs["characteristics"]:
@@ -590,7 +571,7 @@ def parse_radiology_sample(file_path):
                     else:
                         char_values[char_field] = "#N/A"
             else:
-                print(f"          ⚠️  No characteristics found")
+                emit(f"          ⚠️  No characteristics found")
                 # No characteristics found
                 for char_field in ["confidence", "subtlety", "obscuration", "reason"]:
                     if char_field in expected_attrs["characteristics"]:
@@ -602,15 +583,15 @@ def parse_radiology_sample(file_path):
             subtlety = char_values.get("subtlety", "#N/A")
             obscuration = char_values.get("obscuration", "#N/A")
             reason = char_values.get("reason", "#N/A")
-            print(f"          📊 Extracted: confidence={confidence}, subtlety={subtlety}, obscuration={obscuration}, reason={reason}")
+            emit(f"          📊 Extracted: confidence={confidence}, subtlety={subtlety}, obscuration={obscuration}, reason={reason}")
 
             # Process ROI elements with expected vs missing logic
-            print(f"          🔍 Processing ROI elements...")
-            rois = unblinded.findall(tag('roi'))
-            print(f"          📊 Found {len(rois)} ROI elements")
+            emit(f"          🔍 Processing ROI elements...")
+            rois = unblinded.findall(tags['roi'])
+            emit(f"          📊 Found {len(rois)} ROI elements")
             
             if not rois:
-                print(f"          ⚠️  No ROIs found - creating entry with missing ROI data")
+                emit(f"          ⚠️  No ROIs found - creating entry with missing ROI data")
                 # No ROIs found - determine what should be marked as MISSING vs N/A
                 sop_uid = "MISSING" if "imageSOP_UID" in expected_attrs["roi"] else "#N/A"
                 x = "MISSING" if "xCoord" in expected_attrs["roi"] else "#N/A"
@@ -631,24 +612,14 @@ def parse_radiology_sample(file_path):
                     "X_coord": x,
                     "Y_coord": y,
                     "CoordCount": 0,  # No coordinates
-                    "StudyInstanceUID": study_uid,
-                    "SeriesInstanceUID": series_uid,
-                    "Modality": modality,
-                    "DateService": date_service,
-                    "TimeService": time_service
                 }
                 
-                if is_last_radiologist:
-                    unblinded_data_rows.append(row_data)
-                    print(f"          ✅ Added row to unblinded data")
-                else:
-                    data_rows.append(row_data)
-                    print(f"          ✅ Added row to main data")
+                session_rows.append(row_data)
             else:
                 for roi_idx, roi in enumerate(rois):
-                    print(f"            🔍 Processing ROI {roi_idx + 1}/{len(rois)}")
+                    emit(f"            🔍 Processing ROI {roi_idx + 1}/{len(rois)}")
                     # Parse ROI data with expected vs missing logic
-                    sop_uid_elem = roi.find(tag('imageSOP_UID'))
+                    sop_uid_elem = roi.find(tags['imageSOP_UID'])
                     if sop_uid_elem is not None and sop_uid_elem.text:
                         sop_uid = sop_uid_elem.text
                     elif "imageSOP_UID" in expected_attrs["roi"]:
@@ -657,30 +628,30 @@ def parse_radiology_sample(file_path):
                         sop_uid = "#N/A"
                     
                     # Get coordinates including Z position from edgeMap with expected vs missing logic
-                    print(f"            🔍 Extracting coordinates...")
+                    emit(f"            🔍 Extracting coordinates...")
                     x, y, z = "#N/A", "#N/A", "#N/A"  # Default values
                     
                     # First, try to get imageZposition from roi level
-                    z_elem = roi.find(tag('imageZposition'))
+                    z_elem = roi.find(tags['imageZposition'])
                     if z_elem is not None and z_elem.text:
                         z = z_elem.text
-                        print(f"            📍 Z coordinate from ROI level: {z}")
+                        emit(f"            📍 Z coordinate from ROI level: {z}")
                     
-                    edge_maps = roi.findall(tag('edgeMap'))
-                    print(f"            📊 Found {len(edge_maps)} edge maps")
+                    edge_maps = roi.findall(tags['edgeMap'])
+                    emit(f"            📊 Found {len(edge_maps)} edge maps")
                     
                     if edge_maps:
                         # Use the first edge map for coordinates
                         first_edge = edge_maps[0]
-                        x_elem = first_edge.find(tag('xCoord'))
-                        y_elem = first_edge.find(tag('yCoord'))
+                        x_elem = first_edge.find(tags['xCoord'])
+                        y_elem = first_edge.find(tags['yCoord'])
                         
                         # Also try to get z from edgeMap if not found at roi level
                         if z == "#N/A":
-                            z_edge_elem = first_edge.find(tag('imageZposition'))
+                            z_edge_elem = first_edge.find(tags['imageZposition'])
                             if z_edge_elem is not None and z_edge_elem.text:
                                 z = z_edge_elem.text
-                                print(f"            📍 Z coordinate from edge map: {z}")
+                                emit(f"            📍 Z coordinate from edge map: {z}")
                         
                         if x_elem is not None and x_elem.text:
                             x = x_elem.text
@@ -692,17 +663,17 @@ def parse_radiology_sample(file_path):
                         elif "yCoord" in expected_attrs["roi"]:
                             y = "MISSING"
                         
-                        print(f"            📍 Coordinates extracted: X={x}, Y={y}, Z={z}")
+                        emit(f"            📍 Coordinates extracted: X={x}, Y={y}, Z={z}")
                     else:
                         # Look for single edge map (original format)
-                        edge = roi.find(tag('edgeMap'))
+                        edge = roi.find(tags['edgeMap'])
                         if edge is not None:
-                            x_elem = edge.find(tag('xCoord'))
-                            y_elem = edge.find(tag('yCoord'))
+                            x_elem = edge.find(tags['xCoord'])
+                            y_elem = edge.find(tags['yCoord'])
                             
                             # Also try to get z from edgeMap if not found at roi level
                             if z == "#N/A":
-                                z_edge_elem = edge.find(tag('imageZposition'))
+                                z_edge_elem = edge.find(tags['imageZposition'])
                                 if z_edge_elem is not None and z_edge_elem.text:
                                     z = z_edge_elem.text
                             
@@ -723,7 +694,7 @@ def parse_radiology_sample(file_path):
                                 y = "MISSING"
 
                     # Count coordinates for this ROI to determine if it's a detailed session
-                    edge_maps = roi.findall(tag('edgeMap'))
+                    edge_maps = roi.findall(tags['edgeMap'])
                     coord_count = len(edge_maps)
                     
                     # Mark sessions with many coordinates as "Detailed"
@@ -744,23 +715,139 @@ def parse_radiology_sample(file_path):
                         "Y_coord": float(y) if y not in ["#N/A", "MISSING"] and str(y).replace('.', '', 1).isdigit() else y,
                         "Z_coord": float(z) if z not in ["#N/A", "MISSING"] and str(z).replace('.', '', 1).isdigit() else z,
                         "CoordCount": coord_count,  # Track number of coordinates
-                        "StudyInstanceUID": study_uid,
-                        "SeriesInstanceUID": series_uid,
-                        "Modality": modality,
-                        "DateService": date_service,
-                        "TimeService": time_service
                     }
                     
-                    if is_last_radiologist:
-                        unblinded_data_rows.append(row_data)
-                        print(f"            ✅ Added ROI row to unblinded data")
-                    else:
-                        data_rows.append(row_data)
-                        print(f"            ✅ Added ROI row to main data")
+                    session_rows.append(row_data)
+
+        return session_rows
 
-    print(f"  🏁 Parsing complete for {file_id}")
-    print(f"    📊 Main data rows: {len(data_rows)}")
-    print(f"    📊 Unblinded data rows: {len(unblinded_data_rows)}")
+    # Stream the document: only the header and the session elements are materialized,
+    # and each session is cleared (with any already-handled siblings) once parsed
+    emit(f"  🔄 Streaming XML structure...")
+    header = None
+    session_rows_by_tag = {'readingSession': [], 'CXRreadingSession': []}
+    context = etree.iterparse(
+        file_path,
+        events=('end',),
+        tag=('{*}ResponseHeader', '{*}readingSession', '{*}CXRreadingSession'),
+        huge_tree=False,
+        collect_ids=False,
+        resolve_entities=False,
+    )
+    for _, elem in context:
+        if xml_root is None:
+            init_root(elem.getroottree().getroot())
+        
+        # Only direct children of the root count, matching root.find/findall
+        if elem.getparent() is not xml_root:
+            continue
+        
+        local_name = elem.tag.split('}')[-1]
+        if elem.tag != tags[local_name]:
+            continue
+        
+        if local_name == 'ResponseHeader':
+            if header is None:
+                header = elem
+            continue
+        
+        rows_for_tag = session_rows_by_tag[local_name]
+        rows_for_tag.append(parse_session(elem, len(rows_for_tag)))
+        
+        elem.clear()
+        while elem.getprevious() is not None:
+            del xml_root[0]
+    
+    if xml_root is None:
+        init_root(context.root)
+    
+    # Extract header information with expected vs missing logic
+    emit(f"  🔍 Extracting header information...")
+    header_values = {}
+    
+    if header is not None:
+        emit(f"  ✅ ResponseHeader found")
+        debug_info.append("✓ ResponseHeader found")
+        
+        # Check each expected header field
+        for field in ["StudyInstanceUID", "SeriesInstanceUID", "SeriesInstanceUid", "Modality", "DateService", "TimeService"]:
+            if field == "SeriesInstanceUID":
+                # Handle different spelling variations
+                elem = header.find(tags['SeriesInstanceUID'])
+                if elem is None:
+                    elem = header.find(tags['SeriesInstanceUid'])
+                field_key = "SeriesInstanceUID"
+            else:
+                elem = header.find(tags[field])
+                field_key = field
+            
+            if elem is not None and elem.text:
+                header_values[field_key] = elem.text
+            elif field_key in expected_attrs["header"]:
+                header_values[field_key] = "MISSING"
+                debug_info.append(f"⚠️  {field_key} expected but MISSING")
+            else:
+                header_values[field_key] = "#N/A"
+    else:
+        emit(f"  ⚠️  ResponseHeader NOT FOUND")
+        debug_info.append("❌ ResponseHeader NOT FOUND")
+        # Set all header fields based on expectations
+        for field in ["StudyInstanceUID", "SeriesInstanceUID", "Modality", "DateService", "TimeService"]:
+            if field in expected_attrs["header"]:
+                header_values[field] = "MISSING"
+            else:
+                header_values[field] = "#N/A"
+    
+    # Extract values with defaults
+    header_columns = {
+        "StudyInstanceUID": header_values.get("StudyInstanceUID", "#N/A"),
+        "SeriesInstanceUID": header_values.get("SeriesInstanceUID", "#N/A"),
+        "Modality": header_values.get("Modality", "#N/A"),
+        "DateService": header_values.get("DateService", "#N/A"),
+        "TimeService": header_values.get("TimeService", "#N/A"),
+    }
+    study_uid = header_columns["StudyInstanceUID"]
+    emit(f"  📊 Header extracted: StudyUID={study_uid[:20]}...{'(truncated)' if len(study_uid) > 20 else ''}")
+
+    # Look for session elements
+    sessions = session_rows_by_tag[session_tag]
+    emit(f"  📊 Found {len(sessions)} sessions (searching for {session_tag})")
+    debug_info.append(f"Sessions found: {len(sessions)} (looking for {session_tag})")
+    
+    if not sessions:
+        emit(f"  ⚠️  No sessions found - trying alternative session tags")
+        debug_info.append(f"❌ NO SESSIONS FOUND - trying alternative session tags")
+        # Try alternative session tags
+        alt_sessions = session_rows_by_tag['readingSession'] + session_rows_by_tag['CXRreadingSession']
+        emit(f"  📊 Alternative sessions found: {len(alt_sessions)}")
+        debug_info.append(f"Alternative sessions: {len(alt_sessions)}")
+        if alt_sessions:
+            sessions = alt_sessions
+            emit(f"  ✅ Using alternative sessions")
+            debug_info.append("✓ Using alternative sessions")
+    
+    # Print debug info for files with issues
+    if not sessions or any("❌" in info for info in debug_info):
+        emit(f"\nDEBUG INFO for {file_id}:")
+        for info in debug_info:
+            emit(f"  {info}")
+        if not sessions:
+            emit(f"  Root children: {[child.tag for child in xml_root]}")
+
+    # The last radiologist's session is the unblinded read; header columns go last
+    data_rows = []
+    unblinded_data_rows = []
+    for session_idx, session_rows in enumerate(sessions):
+        for row_data in session_rows:
+            row_data.update(header_columns)
+        if session_idx == len(sessions) - 1:
+            unblinded_data_rows.extend(session_rows)
+        else:
+            data_rows.extend(session_rows)
+
+    emit(f"  🏁 Parsing complete for {file_id}")
+    emit(f"    📊 Main data rows: {len(data_rows)}")
+    emit(f"    📊 Unblinded data rows: {len(unblinded_data_rows)}")
     return pd.DataFrame(data_rows), pd.DataFrame(unblinded_data_rows)
 def parse_multiple(files):
     """
@@ -843,54 +930,188 @@ def parse_multiple(files):
     return case_data, case_unblinded_data
 
 
+def set_parse_case_cache(path):
+    """
+    Choose where detect_parse_case keeps its results
+    
+    The on-disk cache is a shelve file and is not safe for several processes
+    writing at once; give concurrent jobs separate paths. Entries are never
+    evicted, so delete the file to reclaim space.
+    
+    args:
+        path: shelve file path, or None to cache in memory only
+    """
+    global PARSE_CASE_CACHE_PATH
+    _close_parse_case_cache()
+    PARSE_CASE_CACHE_PATH = path
+
+
+def _close_parse_case_cache():
+    """Close the current cache; the next lookup reopens PARSE_CASE_CACHE_PATH"""
+    global _parse_case_cache
+    if isinstance(_parse_case_cache, shelve.Shelf):
+        try:
+            _parse_case_cache.close()
+        except Exception:
+            pass
+    _parse_case_cache = None
+
+
+def _get_parse_case_cache():
+    """Open the parse case cache on first use; falls back to an in-memory dict"""
+    global _parse_case_cache
+    if _parse_case_cache is None:
+        if PARSE_CASE_CACHE_PATH is None:
+            _parse_case_cache = {}
+        else:
+            try:
+                _parse_case_cache = shelve.open(PARSE_CASE_CACHE_PATH)
+            except Exception as e:
+                _parse_case_cache_failed(e)
+    return _parse_case_cache
+
+
+def _parse_case_cache_failed(error):
+    """Drop an unreadable or unwritable on-disk cache for the in-memory one"""
+    global _parse_case_cache
+    logger.warning("Parse case cache %s unavailable (%s); caching in memory only",
+                   PARSE_CASE_CACHE_PATH, error)
+    _close_parse_case_cache()
+    _parse_case_cache = {}
+
+
+def _parse_case_cache_get(key):
+    """Cached parse case for key, or None on a miss or cache error"""
+    try:
+        return _get_parse_case_cache().get(key)
+    except Exception as e:
+        _parse_case_cache_failed(e)
+        return None
+
+
+def _parse_case_cache_put(key, parse_case):
+    """Remember a parse case; cache errors never fail classification"""
+    if parse_case == "XML_Parse_Error":
+        return
+    try:
+        _get_parse_case_cache()[key] = parse_case
+    except Exception as e:
+        _parse_case_cache_failed(e)
+        _parse_case_cache[key] = parse_case
+
+
+atexit.register(_close_parse_case_cache)
+
+
+def _parse_case_cache_key(file_path):
+    """Cache key for a file's current contents, or None if it cannot be stat'ed"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return f"{_PARSE_CASE_CACHE_VERSION}|{os.path.abspath(file_path)}|{st.st_size}|{st.st_mtime_ns}"
+
+
 def detect_parse_case(file_path):
     """
     Detect the structure/case of an XML file for appropriate parsing strategy
+    
+    Results are cached keyed by path, size and modification time, so
+    re-classifying an unchanged file costs one stat; the cache is in memory
+    unless set_parse_case_cache() or RA_D_PS_PARSE_CASE_CACHE names a file.
+    Parse errors are not cached.
+    """
+    key = _parse_case_cache_key(file_path)
+    if key is None:
+        return _detect_parse_case_uncached(file_path)
+    
+    parse_case = _parse_case_cache_get(key)
+    if parse_case is None:
+        parse_case = _detect_parse_case_uncached(file_path)
+        _parse_case_cache_put(key, parse_case)
+    return parse_case
+
+
+def _detect_parse_case_uncached(file_path):
+    """
+    Classify one XML file without consulting the cache
+    
+    The file is streamed: only the header, the first session's first read and
+    a running session count are kept, and parsing stops as soon as the first
+    read's characteristics settle the case on their own.
     """
     try:
-        tree = ET.parse(file_path)
-        xml_root = tree.getroot()
-        # Get namespace if present
-        m = re.match(r'\{(.*)\}', xml_root.tag)
-        ns_uri = m.group(1) if m else ''
-        def tag(name):
-            return f"{{{ns_uri}}}{name}" if ns_uri else name
-        
-        # Check for basic structure indicators
-        header = root.find(tag('ResponseHeader'))
-        sessions = root.findall(tag('readingSession')) or root.findall(tag('CXRreadingSession'))
-        
-        if not sessions:
-            return "No_Sessions_Found"
-        
-        # Analyze first session for characteristics
-        first_session = sessions[0]
-        unblinded_reads = first_session.findall(tag('unblindedReadNodule')) or first_session.findall(tag('unblindedRead'))
-        
-        if not unblinded_reads:
-            return "No_Reads_Found"
-        
-        # Analyze first read for characteristics
-        first_read = unblinded_reads[0]
-        characteristics = first_read.find(tag('characteristics'))
-        
-        if characteristics is None:
-            return "No_Characteristics"
-        
-        # Count available characteristics
         char_fields = ['confidence', 'subtlety', 'obscuration', 'reason']
-        available_chars = []
-        for field in char_fields:
-            elem = characteristics.find(tag(field))
-            if elem is not None and elem.text:
-                available_chars.append(field)
-        
-        # Determine case based on available characteristics and header completeness
-        header_complete = header is not None
+        header_complete = False
         modality_present = False
-        if header:
-            modality_elem = header.find(tag('Modality'))
-            modality_present = modality_elem is not None and modality_elem.text
+        session_count = 0
+        reads_in_first_session = 0
+        available_chars = None
+        depth = 0
+        for event, elem in etree.iterparse(
+            file_path, events=('start', 'end'), huge_tree=False, collect_ids=False, resolve_entities=False
+        ):
+            if event == 'start':
+                depth += 1
+                if depth == 1:
+                    # Get namespace if present; children must share it, as with root.find.
+                    # Every qualified tag the detection needs is built once here.
+                    ns_uri = _namespace_uri(elem.tag)
+                    tags = {name: f"{{{ns_uri}}}{name}" if ns_uri else name for name in _DETECT_TAG_NAMES}
+                    header_tag = tags['ResponseHeader']
+                    session_tags = (tags['readingSession'], tags['CXRreadingSession'])
+                    read_tags = (tags['unblindedReadNodule'], tags['unblindedRead'])
+                    char_tags = [(field, tags[field]) for field in char_fields]
+                elif depth == 2 and elem.tag in session_tags:
+                    session_count += 1
+                continue
+            
+            depth -= 1
+            if depth == 1:
+                # Direct child of the root finished
+                if elem.tag == header_tag and not header_complete:
+                    header_complete = True
+                    modality_elem = elem.find(tags['Modality'])
+                    modality_present = modality_elem is not None and modality_elem.text
+                elif elem.tag in session_tags and session_count == 1 and not reads_in_first_session:
+                    return "No_Reads_Found"
+            elif depth == 2 and elem.tag in read_tags and elem.getparent().tag in session_tags:
+                if session_count == 1:
+                    reads_in_first_session += 1
+                if available_chars is None and session_count == 1:
+                    # Analyze first read of the first session for characteristics
+                    characteristics = elem.find(tags['characteristics'])
+                    if characteristics is None:
+                        return "No_Characteristics"
+                    
+                    # Count available characteristics
+                    available_chars = []
+                    for field, field_tag in char_tags:
+                        field_elem = characteristics.find(field_tag)
+                        if field_elem is not None and field_elem.text:
+                            available_chars.append(field)
+                    
+                    # Stop here unless the answer still depends on a header not yet
+                    # seen or on the total number of sessions
+                    rests_on_header = (len(available_chars) >= 3 and 'reason' in available_chars
+                                       and not header_complete)
+                    rests_on_sessions = not (
+                        'reason' in available_chars and len(available_chars) >= 2
+                        or ('confidence' in available_chars and 'subtlety' in available_chars)
+                        or len(available_chars) == 1
+                    )
+                    if not (rests_on_header or rests_on_sessions):
+                        break
+            else:
+                continue
+            
+            # Drop finished reads/sessions (and already-handled siblings) to keep memory flat
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        
+        if not session_count:
+            return "No_Sessions_Found"
         
         # Classification logic
         if len(available_chars) >= 3 and 'reason' in available_chars and header_complete and modality_present:
@@ -901,24 +1122,62 @@ def detect_parse_case(file_path):
             return "Core_Attributes_Only"
         elif len(available_chars) == 1:
             return "Minimal_Attributes"
-        elif len(sessions) == 1:
+        elif session_count == 1:
             return "LIDC_Single_Session"
-        elif len(sessions) == 2:
+        elif session_count == 2:
             return "LIDC_Multi_Session_2"
-        elif len(sessions) == 3:
+        elif session_count == 3:
             return "LIDC_Multi_Session_3"
-        elif len(sessions) == 4:
+        elif session_count == 4:
             return "LIDC_Multi_Session_4"
         else:
             return "Unknown_Structure"
             
     except Exception as e:
-        print(f"Error detecting parse case for {file_path}: {e}")
+        logger.warning("Error detecting parse case for %s: %s", file_path, e)
         return "XML_Parse_Error"
 
 
+def classify_files(file_paths, workers=None, chunksize=16):
+    """
+    Run detect_parse_case over many files in parallel worker processes
+    
+    Each call only needs its path, so files are handed out to a process pool in
+    chunks (amortizing the pickling round-trips) and parsed outside the GIL.
+    Files already in the parse case cache are answered without parsing.
+    
+    args:
+        file_paths: list of XML file paths
+        workers: number of worker processes (default: one per CPU)
+        chunksize: paths sent to a worker per task
+        
+    returns:
+        dict: file path -> parse case, in input order
+    """
+    file_paths = list(file_paths)
+    if not file_paths:
+        return {}
+    
+    # Cache lookups and writes stay in this process; workers only classify misses
+    keys = {file_path: _parse_case_cache_key(file_path) for file_path in file_paths}
+    results = {
+        file_path: _parse_case_cache_get(key) if key is not None else None
+        for file_path, key in keys.items()
+    }
+    misses = [file_path for file_path, parse_case in results.items() if parse_case is None]
+    
+    if misses:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for file_path, parse_case in zip(misses, executor.map(_detect_parse_case_uncached, misses, chunksize=chunksize)):
+                results[file_path] = parse_case
+                if keys[file_path] is not None:
+                    _parse_case_cache_put(keys[file_path], parse_case)
+    return results
+
+
 if __name__ == "__main__":
     # This allows the module to be run directly for testing
+    import tkinter as tk
     root = tk.Tk()
     # NYTXMLGuiApp is undefined; replace with a placeholder or comment
     # app = NYTXMLGuiApp(root)
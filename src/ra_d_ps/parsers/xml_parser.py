@@ -369,13 +369,11 @@ class XMLParser(BaseParser):
         nodules = []
         
         # Find all reading sessions (LIDC or CXR format)
-        sessions = (root.findall(tag('readingSession')) or 
-                   root.findall(tag('CXRreadingSession')))
+        sessions = self._find_children(root, tag('readingSession'), tag('CXRreadingSession'))
         
         for session_idx, session in enumerate(sessions):
             # Find unblinded nodule reads
-            unblinded_reads = (session.findall(tag('unblindedReadNodule')) or
-                              session.findall(tag('unblindedRead')))
+            unblinded_reads = self._find_children(session, tag('unblindedReadNodule'), tag('unblindedRead'))
             
             for unblinded in unblinded_reads:
                 nodule_data = self._extract_single_nodule(
@@ -554,8 +552,7 @@ class XMLParser(BaseParser):
         readings = []
         
         # Find all reading sessions
-        sessions = (root.findall(tag('readingSession')) or 
-                   root.findall(tag('CXRreadingSession')))
+        sessions = self._find_children(root, tag('readingSession'), tag('CXRreadingSession'))
         
         for session_idx, session in enumerate(sessions):
             # Extract radiologist ID
@@ -576,6 +573,30 @@ class XMLParser(BaseParser):
         
         return readings
     
+    def _find_children(self, parent: ET.Element, *tags: str) -> List[ET.Element]:
+        """
+        Children with the first of tags that occurs, in one pass over parent.
+        
+        Same result as parent.findall(tags[0]) or parent.findall(tags[1]) or ...,
+        without rescanning the children for each alternative.
+        
+        Args:
+            parent: Element whose direct children are searched
+            tags: Qualified tags in order of preference
+            
+        Returns:
+            Matching child elements in document order
+        """
+        found = {name: [] for name in tags}
+        for child in parent:
+            matches = found.get(child.tag)
+            if matches is not None:
+                matches.append(child)
+        for name in tags:
+            if found[name]:
+                return found[name]
+        return []
+    
     def _extract_namespace(self, root: ET.Element) -> str:
         """
         Extract XML namespace from root element.
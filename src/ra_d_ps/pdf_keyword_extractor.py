@@ -11,8 +11,14 @@ Integrates with KeywordNormalizer for term standardization and
 KeywordRepository for database persistence.
 """
 
+import os
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
+from functools import partial
+from itertools import chain, islice, repeat
 from pathlib import Path
 from typing import List, Dict, Optional, Set
 import pdfplumber
@@ -45,6 +51,100 @@ class ExtractedPDFKeyword:
     normalized_form: Optional[str] = None
 
 
+# default worker process count for extract_from_multiple
+DEFAULT_MAX_WORKERS = min(os.cpu_count() or 1, 8)
+
+# pdfs read ahead per worker by extract_from_multiple; bounds how many pdfs'
+# text is held in memory at once
+READ_AHEAD_PER_WORKER = 2
+
+# each page worker opens its own copy of the pdf, so short page runs are
+# cheaper to read in this process
+MIN_PAGES_PER_WORKER = 4
+
+
+def _read_page_texts(pdf_path: str, page_numbers: List[int]) -> List[str]:
+    """
+    read the text of the given pages (1-based) from a separately opened pdf.
+    
+    pdfplumber documents are not shareable between workers, so each call
+    opens its own.
+    """
+    with pdfplumber.open(pdf_path, pages=page_numbers) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages]
+
+
+def _read_pdf_pages(
+    pdf_path: str,
+    max_pages: Optional[int] = None,
+    max_workers: int = 1
+) -> tuple[Dict, Optional[str], List[str]]:
+    """
+    read pdf metadata and page text.
+    
+    text extraction is the cpu-bound part of processing a pdf; this lives
+    at module level so extract_from_multiple can run it in worker processes.
+    
+    args:
+        pdf_path: path to pdf file
+        max_pages: optional maximum number of pages to read
+        max_workers: worker processes to split the pages across; long pdfs
+            are read in contiguous page runs of at least MIN_PAGES_PER_WORKER
+        
+    returns:
+        tuple of (pdf metadata, first page text or None for an empty pdf,
+        list of page texts)
+    """
+    pdf_path = Path(pdf_path)
+    if not pdf_path.exists():
+        raise FileNotFoundError(f"pdf not found: {pdf_path}")
+    
+    with pdfplumber.open(pdf_path) as pdf:
+        total_pages = len(pdf.pages)
+        pages_to_process = min(max_pages, total_pages) if max_pages else total_pages
+        page_numbers = range(1, total_pages + 1)[:pages_to_process]
+        
+        workers = min(max_workers, len(page_numbers) // MIN_PAGES_PER_WORKER)
+        if workers > 1:
+            # contiguous runs, concatenated back in page order
+            n = len(page_numbers)
+            runs = [
+                list(page_numbers[i * n // workers:(i + 1) * n // workers])
+                for i in range(workers)
+            ]
+            with ProcessPoolExecutor(workers) as pool:
+                page_texts = list(chain.from_iterable(
+                    pool.map(_read_page_texts, repeat(str(pdf_path)), runs)
+                ))
+        else:
+            page_texts = [pdf.pages[i - 1].extract_text() or "" for i in page_numbers]
+        
+        first_page_text = None
+        if total_pages > 0:
+            first_page_text = page_texts[0] if page_texts else pdf.pages[0].extract_text() or ""
+        
+        return dict(pdf.metadata or {}), first_page_text, page_texts
+
+
+def _read_pdfs_ahead(pool, pdf_paths: List[str], max_pages: Optional[int], window: int):
+    """
+    yield a callable returning each pdf's pages, in input order.
+    
+    at most window reads are submitted and not yet consumed, and each future
+    is dropped once yielded, so only those pdfs' text is held in memory.
+    """
+    paths = iter(pdf_paths)
+    pending = deque(
+        pool.submit(_read_pdf_pages, path, max_pages) for path in islice(paths, window)
+    )
+    while pending:
+        future = pending.popleft()
+        for path in islice(paths, 1):
+            pending.append(pool.submit(_read_pdf_pages, path, max_pages))
+        yield future.result
+        del future
+
+
 class PDFKeywordExtractor:
     """extract keywords from pdf research papers."""
     
@@ -88,7 +188,8 @@ class PDFKeywordExtractor:
         self,
         pdf_path: str,
         store_in_db: bool = True,
-        max_pages: Optional[int] = None
+        max_pages: Optional[int] = None,
+        max_workers: int = 1
     ) -> tuple[PDFMetadata, List[ExtractedPDFKeyword]]:
         """
         extract keywords from pdf file.
@@ -97,75 +198,95 @@ class PDFKeywordExtractor:
             pdf_path: path to pdf file
             store_in_db: whether to store keywords in database
             max_pages: optional maximum number of pages to process
+            max_workers: worker processes to split long pdfs' pages across
+                (default 1: read in this process). each worker reopens the
+                pdf, and on spawn platforms the calling script needs an
+                if __name__ == "__main__": guard
             
         returns:
             tuple of (metadata, list of extracted keywords)
         """
-        pdf_path = Path(pdf_path)
-        if not pdf_path.exists():
-            raise FileNotFoundError(f"pdf not found: {pdf_path}")
+        return self._extract_from_pages(
+            Path(pdf_path),
+            *_read_pdf_pages(pdf_path, max_pages, max_workers),
+            store_in_db=store_in_db
+        )
+    
+    def _extract_from_pages(
+        self,
+        pdf_path: Path,
+        pdf_metadata: Dict,
+        first_page_text: Optional[str],
+        page_texts: List[str],
+        store_in_db: bool = True
+    ) -> tuple[PDFMetadata, List[ExtractedPDFKeyword]]:
+        """
+        extract keywords from text already read by _read_pdf_pages.
+        
+        args:
+            pdf_path: path to pdf file
+            pdf_metadata: pdf metadata dictionary
+            first_page_text: text from first page, None for an empty pdf
+            page_texts: text of each page to process
+            store_in_db: whether to store keywords in database
             
+        returns:
+            tuple of (metadata, list of extracted keywords)
+        """
         metadata = PDFMetadata()
         all_keywords = []
         candidate_keywords = set()
         
-        with pdfplumber.open(pdf_path) as pdf:
-            total_pages = len(pdf.pages)
-            pages_to_process = min(max_pages, total_pages) if max_pages else total_pages
+        # extract metadata from first page
+        if first_page_text is not None:
+            metadata = self._extract_metadata(first_page_text, pdf_metadata)
+        
+        # extract keywords from each page
+        for page_num, page_text in enumerate(page_texts, start=1):
+            # extract abstract from first 2 pages
+            if page_num <= 2 and not metadata.abstract:
+                abstract = self._extract_abstract(page_text)
+                if abstract:
+                    metadata.abstract = abstract
+                    abstract_keywords = self._extract_keywords_from_text(
+                        abstract, 'abstract', page_num
+                    )
+                    all_keywords.extend(abstract_keywords)
             
-            # extract metadata from first page
-            if total_pages > 0:
-                first_page_text = pdf.pages[0].extract_text() or ""
-                metadata = self._extract_metadata(first_page_text, pdf.metadata or {})
+            # extract author keywords from first 2 pages
+            if page_num <= 2 and not metadata.author_keywords:
+                author_kws = self._extract_author_keywords(page_text)
+                if author_kws:
+                    metadata.author_keywords = author_kws
+                    for kw in author_kws:
+                        all_keywords.append(ExtractedPDFKeyword(
+                            text=kw,
+                            category='keyword',
+                            page_number=page_num,
+                            frequency=1
+                        ))
             
-            # extract keywords from each page
-            for page_num, page in enumerate(pdf.pages[:pages_to_process], start=1):
-                page_text = page.extract_text() or ""
-                
-                # extract abstract from first 2 pages
-                if page_num <= 2 and not metadata.abstract:
-                    abstract = self._extract_abstract(page_text)
-                    if abstract:
-                        metadata.abstract = abstract
-                        abstract_keywords = self._extract_keywords_from_text(
-                            abstract, 'abstract', page_num
-                        )
-                        all_keywords.extend(abstract_keywords)
-                
-                # extract author keywords from first 2 pages
-                if page_num <= 2 and not metadata.author_keywords:
-                    author_kws = self._extract_author_keywords(page_text)
-                    if author_kws:
-                        metadata.author_keywords = author_kws
-                        for kw in author_kws:
-                            all_keywords.append(ExtractedPDFKeyword(
-                                text=kw,
-                                category='keyword',
-                                page_number=page_num,
-                                frequency=1
-                            ))
-                
-                # extract body text keywords
-                body_keywords = self._extract_keywords_from_text(
-                    page_text, 'body', page_num
-                )
-                all_keywords.extend(body_keywords)
+            # extract body text keywords
+            body_keywords = self._extract_keywords_from_text(
+                page_text, 'body', page_num
+            )
+            all_keywords.extend(body_keywords)
 
-                # --- Candidate keyword collection for approval ---
-                # Find all unique words/phrases in the page text
-                words = set(re.findall(r'\b[a-zA-Z][a-zA-Z\-]{2,}\b', page_text))
-                # Remove known keywords (already in medical_terms or DB)
-                known_terms = set(self.normalizer.multi_word_set)
-                # Add all normalized forms from DB
-                if self.repository:
-                    db_keywords = {k.keyword_text.lower() for k in self.repository.get_all_keywords(limit=2000)}
-                    known_terms.update(db_keywords)
-                # Remove stopwords and connectors
-                stopwords = self.normalizer.stopwords
-                filtered = [w for w in words if w.lower() not in stopwords and w.lower() not in known_terms and len(w) > 2]
-                # Heuristic: only keep capitalized or long words (likely technical)
-                filtered = [w for w in filtered if w[0].isupper() or len(w) > 6]
-                candidate_keywords.update(filtered)
+            # --- Candidate keyword collection for approval ---
+            # Find all unique words/phrases in the page text
+            words = set(re.findall(r'\b[a-zA-Z][a-zA-Z\-]{2,}\b', page_text))
+            # Remove known keywords (already in medical_terms or DB)
+            known_terms = set(self.normalizer.multi_word_set)
+            # Add all normalized forms from DB
+            if self.repository:
+                db_keywords = {k.keyword_text.lower() for k in self.repository.get_all_keywords(limit=2000)}
+                known_terms.update(db_keywords)
+            # Remove stopwords and connectors
+            stopwords = self.normalizer.stopwords
+            filtered = [w for w in words if w.lower() not in stopwords and w.lower() not in known_terms and len(w) > 2]
+            # Heuristic: only keep capitalized or long words (likely technical)
+            filtered = [w for w in filtered if w[0].isupper() or len(w) > 6]
+            candidate_keywords.update(filtered)
         
         # consolidate duplicate keywords
         all_keywords = self._consolidate_keywords(all_keywords)
@@ -202,38 +323,57 @@ class PDFKeywordExtractor:
         pdf_paths: List[str],
         store_in_db: bool = True,
         max_pages_per_pdf: Optional[int] = None,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        max_workers: Optional[int] = None
     ) -> List[tuple[str, PDFMetadata, List[ExtractedPDFKeyword]]]:
         """
         extract keywords from multiple pdf files.
         
+        pdf text is read in a pool of worker processes. keyword analysis and
+        database writes stay in this process, in input order, so the
+        normalizer and repository are never shared between processes.
+        
         args:
             pdf_paths: list of paths to pdf files
             store_in_db: whether to store keywords in database
             max_pages_per_pdf: optional maximum pages per pdf
             progress_callback: optional callback(current, total, filename)
+            max_workers: optional number of worker processes (default:
+                DEFAULT_MAX_WORKERS); 1 reads every pdf in this process
             
         returns:
             list of (pdf_path, metadata, keywords) tuples
         """
         results = []
         total = len(pdf_paths)
-        
-        for i, pdf_path in enumerate(pdf_paths, start=1):
-            try:
-                if progress_callback:
-                    progress_callback(i, total, Path(pdf_path).name)
-                
-                metadata, keywords = self.extract_from_pdf(
-                    pdf_path,
-                    store_in_db=store_in_db,
-                    max_pages=max_pages_per_pdf
+        if max_workers is None:
+            max_workers = DEFAULT_MAX_WORKERS
+        max_workers = min(max_workers, total)
+        
+        with ProcessPoolExecutor(max_workers) if max_workers > 1 else nullcontext() as pool:
+            # pdfs are read a bounded window ahead; results are collected in order
+            if pool is None:
+                page_reads = (partial(_read_pdf_pages, path, max_pages_per_pdf) for path in pdf_paths)
+            else:
+                page_reads = _read_pdfs_ahead(
+                    pool, pdf_paths, max_pages_per_pdf, READ_AHEAD_PER_WORKER * max_workers
                 )
-                results.append((pdf_path, metadata, keywords))
-                
-            except Exception as e:
-                print(f"error processing {pdf_path}: {e}")
-                continue
+            
+            for i, (pdf_path, read_pages) in enumerate(zip(pdf_paths, page_reads), start=1):
+                try:
+                    if progress_callback:
+                        progress_callback(i, total, Path(pdf_path).name)
+                    
+                    metadata, keywords = self._extract_from_pages(
+                        Path(pdf_path),
+                        *read_pages(),
+                        store_in_db=store_in_db
+                    )
+                    results.append((pdf_path, metadata, keywords))
+                    
+                except Exception as e:
+                    print(f"error processing {pdf_path}: {e}")
+                    continue
         
         return results
     
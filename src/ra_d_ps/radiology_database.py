@@ -10,6 +10,18 @@ import json
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+
+# Rows pulled from SQLite per chunk when copying whole tables into Excel
+EXPORT_CHUNK_ROWS = 50_000
+
+# Header look of pandas' to_excel, which the export used before it streamed
+_HEADER_FONT = Font(bold=True)
+_HEADER_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'),
+                        top=Side(style='thin'), bottom=Side(style='thin'))
+_HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='top')
 
 class RadiologyDatabase:
     """
@@ -17,11 +29,25 @@ class RadiologyDatabase:
     Implements normalized schema with nodule-centric design
     """
     
-    def __init__(self, db_path: str):
-        """Initialize database connection and create tables if needed"""
+    def __init__(self, db_path: str, wal: bool = False):
+        """
+        Initialize database connection and create tables if needed
+        
+        Args:
+            db_path: Path to the SQLite database file
+            wal: Switch the file to write-ahead logging with NORMAL sync for
+                 cheaper commits. The journal mode is stored in the database
+                 file, so this persists after closing and SQLite keeps -wal
+                 and -shm files next to it while it is open.
+        """
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row  # Enable column access by name
+        if wal:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        # ~200 MB page cache keeps the analysis queries' working set in memory
+        self.conn.execute("PRAGMA cache_size=-200000")
         self._create_tables()
         self._create_indexes()
         
@@ -126,7 +152,12 @@ class RadiologyDatabase:
             "CREATE INDEX IF NOT EXISTS idx_ratings_confidence ON radiologist_ratings(confidence)",
             "CREATE INDEX IF NOT EXISTS idx_files_parse_case ON files(parse_case)",
             "CREATE INDEX IF NOT EXISTS idx_files_date ON files(date_service)",
-            "CREATE INDEX IF NOT EXISTS idx_quality_issues_type ON quality_issues(issue_type, severity)"
+            "CREATE INDEX IF NOT EXISTS idx_quality_issues_type ON quality_issues(issue_type, severity)",
+            # Covering indexes so the analysis queries read ratings from the index alone
+            "CREATE INDEX IF NOT EXISTS idx_ratings_nodule_scores ON radiologist_ratings"
+            "(nodule_key, radiologist_id, confidence, subtlety, obscuration)",
+            "CREATE INDEX IF NOT EXISTS idx_ratings_radiologist_scores ON radiologist_ratings"
+            "(radiologist_id, confidence, subtlety, obscuration, file_id) WHERE confidence IS NOT NULL"
         ]
         
         for index_sql in indexes:
@@ -142,11 +173,24 @@ class RadiologyDatabase:
             batch_id = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             
         start_time = datetime.now()
-        files_inserted = 0
-        nodules_inserted = 0 
-        ratings_inserted = 0
         quality_issues = []
         
+        def safe_float(val):
+            if val in ['#N/A', 'MISSING', '', None]:
+                return None
+            try:
+                return float(val)
+            except (ValueError, TypeError):
+                return None
+        
+        def safe_int(val):
+            if val in ['#N/A', 'MISSING', '', None]:
+                return 0
+            try:
+                return int(val)
+            except (ValueError, TypeError):
+                return 0
+        
         try:
             # Group data by file for efficient insertion
             file_groups = {}
@@ -156,19 +200,19 @@ class RadiologyDatabase:
                     file_groups[file_id] = []
                 file_groups[file_id].append(row)
             
+            # Build parameter rows per table, then write each table with one
+            # executemany call inside a single transaction
+            file_params = []
+            nodule_params = []
+            rating_params = []
+            
             for file_id, file_rows in file_groups.items():
                 if not file_rows:
                     continue
                     
-                # Insert file record (use first row for file-level data)
+                # File record (use first row for file-level data)
                 first_row = file_rows[0]
-                
-                self.conn.execute("""
-                INSERT OR REPLACE INTO files (
-                    file_id, file_path, parse_case, study_instance_uid, 
-                    series_instance_uid, modality, date_service, time_service
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+                file_params.append((
                     file_id,
                     first_row.get('FilePath', ''),
                     first_row.get('ParseCase', 'Unknown'),
@@ -178,7 +222,6 @@ class RadiologyDatabase:
                     first_row.get('DateService'),
                     first_row.get('TimeService')
                 ))
-                files_inserted += 1
                 
                 # Group file rows by nodule
                 nodule_groups = {}
@@ -191,39 +234,13 @@ class RadiologyDatabase:
                         nodule_groups[nodule_key] = []
                     nodule_groups[nodule_key].append(row)
                 
-                # Insert nodules and ratings
                 for nodule_key, nodule_rows in nodule_groups.items():
                     if not nodule_rows:
                         continue
                         
                     # Use first row for nodule-level data
                     base_row = nodule_rows[0]
-                    
-                    # Safely convert coordinates
-                    def safe_float(val):
-                        if val in ['#N/A', 'MISSING', '', None]:
-                            return None
-                        try:
-                            return float(val)
-                        except (ValueError, TypeError):
-                            return None
-                    
-                    def safe_int(val):
-                        if val in ['#N/A', 'MISSING', '', None]:
-                            return 0
-                        try:
-                            return int(val)
-                        except (ValueError, TypeError):
-                            return 0
-                    
-                    # Insert nodule
-                    self.conn.execute("""
-                    INSERT OR REPLACE INTO nodules (
-                        nodule_key, file_id, nodule_id, z_coordinate,
-                        x_coordinate, y_coordinate, coordinate_count,
-                        session_type, sop_uid
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
+                    nodule_params.append((
                         nodule_key,
                         file_id,
                         base_row.get('NoduleID', 'unknown'),
@@ -234,9 +251,8 @@ class RadiologyDatabase:
                         base_row.get('SessionType', 'Standard'),
                         base_row.get('SOP_UID')
                     ))
-                    nodules_inserted += 1
                     
-                    # Insert radiologist ratings
+                    # Radiologist ratings
                     for row in nodule_rows:
                         radiologist = row.get('Radiologist', 'Unknown')
                         
@@ -247,20 +263,15 @@ class RadiologyDatabase:
                                 missing_fields.append(field)
                         
                         if missing_fields:
-                            quality_issues.append({
-                                'file_id': file_id,
-                                'nodule_key': nodule_key,
-                                'issue_type': 'missing_data',
-                                'issue_description': f"Missing fields: {', '.join(missing_fields)}",
-                                'severity': 'MEDIUM'
-                            })
+                            quality_issues.append((
+                                file_id,
+                                nodule_key,
+                                'missing_data',
+                                f"Missing fields: {', '.join(missing_fields)}",
+                                'MEDIUM'
+                            ))
                         
-                        self.conn.execute("""
-                        INSERT OR REPLACE INTO radiologist_ratings (
-                            nodule_key, file_id, radiologist_id, 
-                            confidence, subtlety, obscuration, reason
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """, (
+                        rating_params.append((
                             nodule_key,
                             file_id,
                             radiologist,
@@ -269,16 +280,42 @@ class RadiologyDatabase:
                             safe_float(row.get('Obscuration')),
                             row.get('Reason') if row.get('Reason') not in ['#N/A', 'MISSING'] else None
                         ))
-                        ratings_inserted += 1
+            
+            files_inserted = len(file_params)
+            nodules_inserted = len(nodule_params)
+            ratings_inserted = len(rating_params)
+            
+            # Keep sort/temp b-trees for the bulk load off disk
+            self.conn.execute("PRAGMA temp_store=MEMORY")
+            
+            self.conn.executemany("""
+            INSERT OR REPLACE INTO files (
+                file_id, file_path, parse_case, study_instance_uid, 
+                series_instance_uid, modality, date_service, time_service
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, file_params)
+            
+            self.conn.executemany("""
+            INSERT OR REPLACE INTO nodules (
+                nodule_key, file_id, nodule_id, z_coordinate,
+                x_coordinate, y_coordinate, coordinate_count,
+                session_type, sop_uid
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, nodule_params)
+            
+            self.conn.executemany("""
+            INSERT OR REPLACE INTO radiologist_ratings (
+                nodule_key, file_id, radiologist_id, 
+                confidence, subtlety, obscuration, reason
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, rating_params)
             
             # Insert quality issues
-            for issue in quality_issues:
-                self.conn.execute("""
-                INSERT INTO quality_issues (
-                    file_id, nodule_key, issue_type, issue_description, severity
-                ) VALUES (?, ?, ?, ?, ?)
-                """, (issue['file_id'], issue['nodule_key'], issue['issue_type'], 
-                      issue['issue_description'], issue['severity']))
+            self.conn.executemany("""
+            INSERT INTO quality_issues (
+                file_id, nodule_key, issue_type, issue_description, severity
+            ) VALUES (?, ?, ?, ?, ?)
+            """, quality_issues)
             
             # Insert batch statistics
             duration = (datetime.now() - start_time).total_seconds()
@@ -409,40 +446,86 @@ class RadiologyDatabase:
     def export_to_excel(self, output_path: str) -> str:
         """Export database contents to Excel for compatibility"""
         
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            
-            # Nodule analysis (main sheet)
-            nodule_df = self.get_nodule_analysis()
-            nodule_df.to_excel(writer, sheet_name='Nodule Analysis', index=False)
-            
-            # Radiologist performance
-            radiologist_df = self.get_radiologist_performance()
-            radiologist_df.to_excel(writer, sheet_name='Radiologist Performance', index=False)
-            
-            # Raw data tables
-            files_df = pd.read_sql_query("SELECT * FROM files ORDER BY file_id", self.conn)
-            files_df.to_excel(writer, sheet_name='Files', index=False)
-            
-            nodules_df = pd.read_sql_query("SELECT * FROM nodules ORDER BY file_id, nodule_id", self.conn) 
-            nodules_df.to_excel(writer, sheet_name='Nodules', index=False)
-            
-            ratings_df = pd.read_sql_query("""
-                SELECT * FROM radiologist_ratings 
-                ORDER BY file_id, nodule_key, radiologist_id
-            """, self.conn)
-            ratings_df.to_excel(writer, sheet_name='Radiologist Ratings', index=False)
-            
-            # Quality issues
-            quality_df = pd.read_sql_query("SELECT * FROM quality_issues ORDER BY detected_at", self.conn)
-            if not quality_df.empty:
-                quality_df.to_excel(writer, sheet_name='Quality Issues', index=False)
+        # Write-only workbook: appended rows are streamed out to the file rather
+        # than kept in memory as a tree of cells until save
+        wb = Workbook(write_only=True)
+        
+        # Nodule analysis (main sheet)
+        nodule_df = self.get_nodule_analysis()
+        self._write_frame_to_sheet(wb, nodule_df, 'Nodule Analysis')
+        
+        # Radiologist performance
+        radiologist_df = self.get_radiologist_performance()
+        self._write_frame_to_sheet(wb, radiologist_df, 'Radiologist Performance')
+        
+        # Raw data tables
+        self._write_query_to_sheet(wb, "SELECT * FROM files ORDER BY file_id", 'Files')
+        
+        self._write_query_to_sheet(wb, "SELECT * FROM nodules ORDER BY file_id, nodule_id", 'Nodules')
         
+        self._write_query_to_sheet(wb, """
+            SELECT * FROM radiologist_ratings 
+            ORDER BY file_id, nodule_key, radiologist_id
+        """, 'Radiologist Ratings')
+        
+        # Quality issues
+        self._write_query_to_sheet(wb, "SELECT * FROM quality_issues ORDER BY detected_at",
+                                   'Quality Issues', skip_if_empty=True)
+        
+        wb.save(output_path)
         return f"Exported database to Excel: {output_path}"
     
+    def _append_header(self, ws, columns) -> None:
+        """Append a styled header row to a write-only sheet"""
+        header = []
+        for name in columns:
+            cell = WriteOnlyCell(ws, value=name)
+            cell.font = _HEADER_FONT
+            cell.border = _HEADER_BORDER
+            cell.alignment = _HEADER_ALIGNMENT
+            header.append(cell)
+        ws.append(header)
+    
+    def _write_frame_to_sheet(self, wb, df: pd.DataFrame, sheet_name: str) -> int:
+        """Write a DataFrame as a new sheet (header + rows, nulls as empty cells)"""
+        ws = wb.create_sheet(sheet_name)
+        self._append_header(ws, df.columns)
+        for row in df.astype(object).where(df.notna(), None).itertuples(index=False, name=None):
+            ws.append(row)
+        return len(df)
+    
+    def _write_query_to_sheet(self, wb, query: str, sheet_name: str, skip_if_empty: bool = False) -> int:
+        """
+        Stream a query's rows into a new sheet, EXPORT_CHUNK_ROWS at a time
+        
+        Rows go straight from the cursor to the write-only sheet, so the full result
+        is never held in memory. Returns the number of rows written.
+        """
+        cursor = self.conn.execute(query)
+        rows = cursor.fetchmany(EXPORT_CHUNK_ROWS)
+        if not rows and skip_if_empty:
+            return 0
+        
+        ws = wb.create_sheet(sheet_name)
+        self._append_header(ws, [column[0] for column in cursor.description])
+        rows_written = 0
+        while rows:
+            for row in rows:
+                ws.append(tuple(row))
+            rows_written += len(rows)
+            rows = cursor.fetchmany(EXPORT_CHUNK_ROWS)
+        return rows_written
+    
     def close(self):
         """Close database connection"""
         if self.conn:
+            # Let SQLite refresh planner statistics for the indexes it used
+            try:
+                self.conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
             self.conn.close()
+            self.conn = None
             
     def __enter__(self):
         return self
@@ -12,14 +12,15 @@ Version 3.0: Pure database-driven parse case detection (PostgreSQL required)
 - Detection history and statistics tracking
 """
 
-import xml.etree.ElementTree as ET
-import re
 from typing import Dict, List, Set, Tuple, Optional
 from pathlib import Path
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
+from lxml import etree
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -255,31 +256,9 @@ class XMLStructureDetector:
             self.detection_cache[file_path] = parse_case
             
             # Record detection in database if enabled
-            if record_detection and self.use_database and self._repository:
-                try:
-                    detection_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-                    
-                    # Get parse case from database to get ID
-                    db_parse_case = self._repository.get_parse_case_by_name(parse_case)
-                    if db_parse_case:
-                        self._repository.record_detection(
-                            parse_case_id=db_parse_case.id,
-                            file_path=file_path,
-                            detection_metadata={
-                                "detection_time_ms": detection_time_ms,
-                                "cache_hit": False,
-                                "database_driven": True
-                            }
-                        )
-                        
-                        # Update statistics
-                        self._repository.update_statistics(
-                            parse_case_id=db_parse_case.id,
-                            detection_time_ms=detection_time_ms,
-                            success=True
-                        )
-                except Exception as e:
-                    logger.debug(f"Failed to record detection in database: {e}")
+            if record_detection:
+                detection_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+                self._record_detection(file_path, parse_case, detection_time_ms)
             
             return parse_case
             
@@ -287,6 +266,33 @@ class XMLStructureDetector:
             logger.error(f"Error detecting structure for {file_path}: {e}")
             return "XML_Parse_Error"
     
+    def _record_detection(self, file_path: str, parse_case: str, detection_time_ms: int):
+        """Record a fresh detection and its timing in the database, if enabled."""
+        if not (self.use_database and self._repository):
+            return
+        try:
+            # Get parse case from database to get ID
+            db_parse_case = self._repository.get_parse_case_by_name(parse_case)
+            if db_parse_case:
+                self._repository.record_detection(
+                    parse_case_id=db_parse_case.id,
+                    file_path=file_path,
+                    detection_metadata={
+                        "detection_time_ms": detection_time_ms,
+                        "cache_hit": False,
+                        "database_driven": True
+                    }
+                )
+                
+                # Update statistics
+                self._repository.update_statistics(
+                    parse_case_id=db_parse_case.id,
+                    detection_time_ms=detection_time_ms,
+                    success=True
+                )
+        except Exception as e:
+            logger.debug(f"Failed to record detection in database: {e}")
+    
     def _analyze_xml_structure(self, file_path: str) -> str:
         """
         Internal method to analyze XML structure and determine parse case.
@@ -297,33 +303,95 @@ class XMLStructureDetector:
         Returns:
             Parse case identifier string
         """
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        
-        # Extract namespace if present
-        namespace = self._extract_namespace(root)
-        
-        # Analyze key structural elements
-        header_info = self._analyze_header(root, namespace)
-        session_info = self._analyze_sessions(root, namespace)
-        char_info = self._analyze_characteristics(root, namespace)
+        header_info, session_info, char_info = self._extract_features(file_path)
         
         # Apply classification logic
         return self._classify_structure(header_info, session_info, char_info)
     
-    def _extract_namespace(self, root) -> str:
+    @classmethod
+    def _extract_features(cls, file_path: str) -> Tuple[Dict, Dict, Dict]:
+        """
+        Read the header, session and characteristics features of an XML file.
+        
+        The file is streamed: the header and the first session of each kind are
+        analyzed as soon as they end, and every session is dropped once counted,
+        so memory stays flat however many sessions the file holds. Needs no
+        database, so it also runs in batch_detect_structures' worker processes.
+        
+        Args:
+            file_path: Path to XML file
+            
+        Returns:
+            (header_info, session_info, char_info) analysis results
+        """
+        root = None
+        namespace = ''
+        header_info = cls._analyze_header(None, namespace)
+        session_counts = {'readingSession': 0, 'CXRreadingSession': 0}
+        first_char_info = {}
+        
+        context = etree.iterparse(
+            file_path,
+            events=('end',),
+            tag=('{*}ResponseHeader', '{*}readingSession', '{*}CXRreadingSession'),
+            huge_tree=False,
+            collect_ids=False,
+            resolve_entities=False,
+        )
+        for _, elem in context:
+            if root is None:
+                root = elem.getroottree().getroot()
+                namespace = cls._extract_namespace(root)
+            
+            # Only direct children of the root count, matching root.find/findall
+            if elem.getparent() is not root:
+                continue
+            
+            local_name = elem.tag.split('}')[-1]
+            if elem.tag != cls._make_tag(local_name, namespace):
+                continue
+            
+            if local_name == 'ResponseHeader':
+                if not header_info['present']:
+                    header_info = cls._analyze_header(elem, namespace)
+            else:
+                session_counts[local_name] += 1
+                if local_name not in first_char_info:
+                    first_char_info[local_name] = cls._analyze_characteristics(elem, namespace)
+            
+            elem.clear()
+            while elem.getprevious() is not None:
+                del root[0]
+        
+        # readingSession takes precedence over CXRreadingSession, as with findall() or findall()
+        session_kind = 'readingSession' if session_counts['readingSession'] else 'CXRreadingSession'
+        session_info = cls._analyze_sessions(session_counts[session_kind])
+        char_info = first_char_info.get(session_kind) or cls._analyze_characteristics(None, namespace)
+        return header_info, session_info, char_info
+    
+    @staticmethod
+    def _extract_namespace(root) -> str:
         """Extract namespace URI from root element."""
-        match = re.match(r'\{(.*)\}', root.tag)
-        return match.group(1) if match else ''
+        tag = root.tag
+        return tag[1:tag.index('}')] if tag.startswith('{') else ''
     
-    def _make_tag(self, name: str, namespace: str) -> str:
+    @staticmethod
+    def _make_tag(name: str, namespace: str) -> str:
         """Create namespaced tag if namespace exists."""
         return f"{{{namespace}}}{name}" if namespace else name
     
-    def _analyze_header(self, root, namespace: str) -> Dict:
+    @staticmethod
+    def _index_children(parent) -> Dict:
+        """Map each child tag to its first child element, as parent.find(tag) would."""
+        children = {}
+        for child in parent:
+            children.setdefault(child.tag, child)
+        return children
+    
+    @classmethod
+    def _analyze_header(cls, header, namespace: str) -> Dict:
         """Analyze header completeness and content."""
-        tag = lambda name: self._make_tag(name, namespace)
-        header = root.find(tag('ResponseHeader'))
+        tag = lambda name: cls._make_tag(name, namespace)
         
         if header is None:
             return {
@@ -332,13 +400,14 @@ class XMLStructureDetector:
                 'complete': False
             }
         
-        modality_elem = header.find(tag('Modality'))
+        children = cls._index_children(header)
+        modality_elem = children.get(tag('Modality'))
         has_modality = modality_elem is not None and modality_elem.text
         
         # Check for other important header fields
         required_fields = ['StudyInstanceUID', 'SeriesInstanceUID']
         field_count = sum(1 for field in required_fields 
-                         if header.find(tag(field)) is not None)
+                         if tag(field) in children)
         
         return {
             'present': True,
@@ -347,48 +416,40 @@ class XMLStructureDetector:
             'field_count': field_count
         }
     
-    def _analyze_sessions(self, root, namespace: str) -> Dict:
+    @staticmethod
+    def _analyze_sessions(session_count: int) -> Dict:
         """Analyze reading sessions structure."""
-        tag = lambda name: self._make_tag(name, namespace)
-        
-        sessions = (root.findall(tag('readingSession')) or 
-                   root.findall(tag('CXRreadingSession')))
-        
-        session_count = len(sessions)
-        
         return {
             'count': session_count,
-            'present': session_count > 0,
-            'sessions': sessions[:1] if sessions else []  # Keep first for analysis
+            'present': session_count > 0
         }
     
-    def _analyze_characteristics(self, root, namespace: str) -> Dict:
-        """Analyze characteristics availability across sessions."""
-        tag = lambda name: self._make_tag(name, namespace)
-        
-        sessions = (root.findall(tag('readingSession')) or 
-                   root.findall(tag('CXRreadingSession')))
+    @classmethod
+    def _analyze_characteristics(cls, first_session, namespace: str) -> Dict:
+        """Analyze characteristics availability from the first session's first read."""
+        tag = lambda name: cls._make_tag(name, namespace)
         
-        if not sessions:
+        if first_session is None:
             return {
                 'available': [],
                 'count': 0,
                 'has_reason': False
             }
         
-        # Analyze first session's first read
-        first_session = sessions[0]
-        unblinded_reads = (first_session.findall(tag('unblindedReadNodule')) or 
-                          first_session.findall(tag('unblindedRead')))
+        # Analyze first session's first read (unblindedReadNodule preferred, as
+        # with findall() or findall(), from a single pass over the session)
+        session_children = cls._index_children(first_session)
+        first_read = session_children.get(tag('unblindedReadNodule'))
+        if first_read is None:
+            first_read = session_children.get(tag('unblindedRead'))
         
-        if not unblinded_reads:
+        if first_read is None:
             return {
                 'available': [],
                 'count': 0,
                 'has_reason': False
             }
         
-        first_read = unblinded_reads[0]
         characteristics = first_read.find(tag('characteristics'))
         
         if characteristics is None:
@@ -400,17 +461,20 @@ class XMLStructureDetector:
                 'v2_chars': []
             }
         
+        # One pass over the characteristics instead of a find() per field
+        children = cls._index_children(characteristics)
+        
         # Check which characteristics are available (legacy format)
         available_chars = []
-        for field in self.CHARACTERISTIC_FIELDS:
-            elem = characteristics.find(tag(field))
+        for field in cls.CHARACTERISTIC_FIELDS:
+            elem = children.get(tag(field))
             if elem is not None and elem.text:
                 available_chars.append(field)
         
         # Check for LIDC v2 format characteristics
         v2_chars = []
-        for field in self.LIDC_V2_FIELDS:
-            elem = characteristics.find(tag(field))
+        for field in cls.LIDC_V2_FIELDS:
+            elem = children.get(tag(field))
             if elem is not None and elem.text:
                 v2_chars.append(field)
         
@@ -449,12 +513,19 @@ class XMLStructureDetector:
             logger.error("No parse case matched in database. Check parse case definitions and detection criteria.")
             return "Unknown_Structure"
     
-    def batch_detect_structures(self, file_paths: List[str]) -> Dict[str, str]:
+    def batch_detect_structures(self, file_paths: List[str], workers: Optional[int] = None,
+                                chunksize: int = 16) -> Dict[str, str]:
         """
         Detect structures for a batch of files efficiently.
         
+        Reading the XML needs nothing but the path, so uncached files are handed
+        to a process pool in chunks; classification against the database parse
+        cases, caching and detection history stay in this process.
+        
         Args:
             file_paths: List of file paths to analyze
+            workers: Number of worker processes (default: one per CPU)
+            chunksize: Paths sent to a worker per task
             
         Returns:
             Dictionary mapping file paths to their parse cases
@@ -464,17 +535,35 @@ class XMLStructureDetector:
         
         logger.info(f"🔍 Starting structure detection for {total_files} files...")
         
-        for i, file_path in enumerate(file_paths, 1):
-            try:
-                parse_case = self.detect_structure_type(file_path)
-                results[file_path] = parse_case
-                
-                if i % 10 == 0 or i == total_files:
-                    logger.info(f"🔍 Structure detection progress: {i}/{total_files}")
+        pending = []
+        for file_path in file_paths:
+            if file_path in self.detection_cache:
+                results[file_path] = self.detection_cache[file_path]
+            elif file_path not in results:
+                results[file_path] = None
+                pending.append(file_path)
+        
+        if pending:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                outcomes = executor.map(_extract_structure_features, pending, chunksize=chunksize)
+                done = total_files - len(pending)
+                for file_path, (features, error, detection_time_ms) in zip(pending, outcomes):
+                    done += 1
+                    if error is not None:
+                        logger.error(f"Error detecting structure for {file_path}: {error}")
+                        results[file_path] = "XML_Parse_Error"
+                    else:
+                        try:
+                            parse_case = self._classify_structure(*features)
+                            self.detection_cache[file_path] = parse_case
+                            self._record_detection(file_path, parse_case, detection_time_ms)
+                            results[file_path] = parse_case
+                        except Exception as e:
+                            logger.error(f"Failed to detect structure for {file_path}: {e}")
+                            results[file_path] = "XML_Parse_Error"
                     
-            except Exception as e:
-                logger.error(f"Failed to detect structure for {file_path}: {e}")
-                results[file_path] = "XML_Parse_Error"
+                    if done % 10 == 0 or done == total_files:
+                        logger.info(f"🔍 Structure detection progress: {done}/{total_files}")
         
         # Print summary
         case_counts = {}
@@ -587,6 +676,21 @@ class XMLStructureDetector:
         }
 
 
+def _extract_structure_features(file_path: str) -> Tuple[Optional[Tuple[Dict, Dict, Dict]], Optional[str], int]:
+    """
+    Worker entry point for batch_detect_structures.
+    
+    Returns:
+        (features, error message, detection time in ms); features is None on error
+    """
+    start_time = datetime.now()
+    try:
+        features = XMLStructureDetector._extract_features(file_path)
+    except Exception as e:
+        return None, str(e), 0
+    return features, None, int((datetime.now() - start_time).total_seconds() * 1000)
+
+
 # Convenience functions for backward compatibility
 def detect_parse_case(file_path: str) -> str:
     """
@@ -19,11 +19,13 @@ def format_timestamp(dt: datetime.datetime = None) -> str:
 
 def validate_xml_file(file_path: str) -> bool:
     """Validate that file is a readable XML file"""
+    # A well-formedness check needs no tree: feed the file straight to expat
+    from xml.parsers import expat  # pylint: disable=import-outside-toplevel
     try:
-        import xml.etree.ElementTree as ET  # pylint: disable=import-outside-toplevel
-        ET.parse(file_path)
+        with open(file_path, 'rb') as xml_file:
+            expat.ParserCreate().ParseFile(xml_file)
         return True
-    except (ET.ParseError, FileNotFoundError, PermissionError):
+    except (expat.ExpatError, FileNotFoundError, PermissionError):
         return False
 
 
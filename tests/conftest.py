@@ -0,0 +1,59 @@
+"""
+Shared fixtures for the parse case and structure detection tests.
+"""
+
+import pytest
+
+
+LIDC_XML_TEMPLATE = (
+    '<LidcReadMessage xmlns="http://www.nih.gov">'
+    '<ResponseHeader><StudyInstanceUID>1.2</StudyInstanceUID><Modality>CT</Modality></ResponseHeader>'
+    '<readingSession><unblindedReadNodule><noduleID>N1</noduleID>'
+    '<characteristics>{}</characteristics>'
+    '</unblindedReadNodule></readingSession></LidcReadMessage>'
+)
+
+# One XML body per parse case, keyed by the case detect_parse_case gives it
+PARSE_CASE_XML = {
+    "Complete_Attributes": LIDC_XML_TEMPLATE.format(
+        '<subtlety>3</subtlety><confidence>4</confidence>'
+        '<obscuration>2</obscuration><reason>x</reason>'
+    ),
+    "Minimal_Attributes": LIDC_XML_TEMPLATE.format('<subtlety>3</subtlety>'),
+    "LIDC_Single_Session": LIDC_XML_TEMPLATE.format(''),
+    "No_Sessions_Found": (
+        '<LidcReadMessage><ResponseHeader><Modality>CT</Modality>'
+        '</ResponseHeader></LidcReadMessage>'
+    ),
+    "XML_Parse_Error": "<oops",
+}
+
+
+@pytest.fixture
+def parse_case_xml():
+    """XML bodies keyed by their expected parse case."""
+    return dict(PARSE_CASE_XML)
+
+
+@pytest.fixture
+def xml_case_files(tmp_path):
+    """Files of every parse case, interleaved, with their expected parse case."""
+    expected = {}
+    for i in range(3):
+        for case, body in PARSE_CASE_XML.items():
+            path = tmp_path / f"{i}_{case}.xml"
+            path.write_text(body)
+            expected[str(path)] = case
+    return expected
+
+
+@pytest.fixture
+def forbid_process_pool(monkeypatch):
+    """Make a module fail the test if it starts a ProcessPoolExecutor."""
+    def forbid(module):
+        def no_pool(*args, **kwargs):
+            raise AssertionError("cached files should not start a pool")
+
+        monkeypatch.setattr(module, "ProcessPoolExecutor", no_pool)
+
+    return forbid
@@ -0,0 +1,57 @@
+"""
+Tests for parallel parse case classification.
+
+Run with: pytest -q tests/test_classify_files.py
+"""
+
+import pytest
+
+from src.ra_d_ps import parser
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Classify every file from scratch, with no cache file."""
+    parser.set_parse_case_cache(None)
+    yield
+    parser.set_parse_case_cache(None)
+
+
+def test_results_in_input_order(xml_case_files):
+    """Test results come back keyed and ordered like the input paths."""
+    paths = list(reversed(list(xml_case_files)))
+    results = parser.classify_files(paths, workers=2, chunksize=2)
+
+    assert list(results) == paths
+    assert results == {path: xml_case_files[path] for path in paths}
+
+
+def test_pool_matches_serial(xml_case_files):
+    """Test one worker, several workers and detect_parse_case agree."""
+    paths = list(xml_case_files)
+    single = parser.classify_files(paths, workers=1)
+    parser.set_parse_case_cache(None)
+    pooled = parser.classify_files(paths, workers=3, chunksize=1)
+    parser.set_parse_case_cache(None)
+    serial = {path: parser.detect_parse_case(path) for path in paths}
+
+    assert single == pooled == serial == xml_case_files
+
+
+def test_cached_files_skip_workers(xml_case_files, forbid_process_pool):
+    """Test files already classified are answered without a pool."""
+    paths = [p for p, case in xml_case_files.items() if case != "XML_Parse_Error"]
+    for path in paths:
+        parser.detect_parse_case(path)
+
+    forbid_process_pool(parser)
+    assert parser.classify_files(paths) == {path: xml_case_files[path] for path in paths}
+
+
+def test_empty_input():
+    """Test no paths gives no results."""
+    assert parser.classify_files([]) == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -51,8 +51,8 @@ try:
             case_fill = PatternFill(start_color=case_color, end_color=case_color, fill_type="solid")
             missing_fill = PatternFill(start_color=missing_color, end_color=missing_color, fill_type="solid")
             
-            # Apply formatting to each row
-            for row_idx, (_, row_data) in enumerate(combined_df.iterrows(), start=2):
+            # Apply formatting to each row (plain tuples, no per-row Series)
+            for row_idx, row_data in enumerate(combined_df.itertuples(index=False, name=None), start=2):
                 for col_idx, cell_value in enumerate(row_data, start=1):
                     cell = worksheet.cell(row=row_idx, column=col_idx)
                     
@@ -8,6 +8,10 @@ import pytest
 from pathlib import Path
 import tempfile
 import shutil
+import gc
+
+from openpyxl import load_workbook
+from openpyxl.worksheet._writer import ALL_TEMP_FILES
 
 from src.ra_d_ps.exporters.excel_exporter import RADPSExcelFormatter, TemplateExcelFormatter
 from src.ra_d_ps.exporters.base import ExportError
@@ -127,6 +131,69 @@ class TestRADPSExcelFormatter:
         
         assert path1 != path2
         assert '_v2' in path2.name or path1.name != path2.name
+    
+    def test_list_sizes_blocks_from_every_record(self, sample_records, temp_dir):
+        """Test a list record past chunk_size still gets all its radiologist blocks."""
+        late = dict(sample_records[1], radiologists={
+            str(r): {"subtlety": r} for r in range(1, 5)
+        })
+        exporter = RADPSExcelFormatter()
+        output_path = exporter.export(sample_records + [late], temp_dir, chunk_size=2)
+        
+        ws = load_workbook(output_path).active
+        headers = [cell.value for cell in ws[1]]
+        assert "R4 Subtlety" in headers
+        assert ws.cell(row=4, column=headers.index("R4 Subtlety") + 1).value == 4
+        assert exporter.last_export_stats.radiologist_blocks == 4
+    
+    @pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+    def test_iterator_with_unreserved_blocks_raises(self, sample_records, temp_dir):
+        """Test an iterator record needing more blocks than reserved is not truncated."""
+        late = dict(sample_records[1], radiologists={
+            str(r): {"subtlety": r} for r in range(1, 5)
+        })
+        records = sample_records + [late]
+        exporter = RADPSExcelFormatter()
+        temp_files = list(ALL_TEMP_FILES)
+        with pytest.raises(ExportError, match="force_blocks=4"):
+            exporter.export(iter(records), temp_dir, chunk_size=2)
+        gc.collect()  # surface any half-written sheet stream now
+        assert ALL_TEMP_FILES == temp_files
+        
+        exporter.export(iter(records), temp_dir, chunk_size=2, force_blocks=4)
+        assert exporter.last_export_stats.radiologist_blocks == 4
+    
+    def test_export_stats(self, sample_records, temp_dir):
+        """Test last_export_stats records what the export wrote."""
+        exporter = RADPSExcelFormatter()
+        assert exporter.last_export_stats is None
+        
+        exporter.export(sample_records, temp_dir)
+        stats = exporter.last_export_stats
+        assert stats.records == 2
+        assert stats.max_radiologists == 2
+        assert stats.radiologist_blocks == 2
+    
+    def test_export_stats_forced_blocks(self, sample_records, temp_dir):
+        """Test forced blocks are reported apart from radiologists seen."""
+        exporter = RADPSExcelFormatter()
+        exporter.export(sample_records, temp_dir, force_blocks=4)
+        stats = exporter.last_export_stats
+        assert stats.records == 2
+        assert stats.max_radiologists == 2
+        assert stats.radiologist_blocks == 4
+    
+    def test_export_stats_streamed(self, sample_records, temp_dir):
+        """Test stats count records streamed past the leading chunk."""
+        records = [dict(rec, file_number=f"{i:03d}")
+                   for i in range(5) for rec in sample_records]
+        exporter = RADPSExcelFormatter()
+        output_path = exporter.export(iter(records), temp_dir, chunk_size=3)
+        stats = exporter.last_export_stats
+        assert stats.records == 10
+        assert stats.max_radiologists == 2
+        assert stats.radiologist_blocks == 2
+        assert load_workbook(output_path).active.max_row == stats.records + 1
 
 
 class TestTemplateExcelFormatter:
@@ -0,0 +1,91 @@
+"""
+Tests for batch characteristic value normalization.
+
+Run with: pytest -q tests/test_keyword_normalizer.py
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.ra_d_ps.keyword_normalizer import KeywordNormalizer
+
+
+class FakeKeywordRepository:
+    """In-memory stand-in for KeywordRepository synonym lookups."""
+
+    def __init__(self):
+        self.synonyms = {}
+        self.lookups = []
+
+    def get_canonical_keyword(self, text):
+        self.lookups.append(text)
+        canonical = self.synonyms.get(text)
+        return SimpleNamespace(keyword_text=canonical) if canonical else None
+
+
+@pytest.fixture(scope="module")
+def normalizer():
+    return KeywordNormalizer()
+
+
+@pytest.mark.parametrize("characteristic", ["subtlety", "Malignancy", "unknown"])
+def test_batch_matches_single_values(normalizer, characteristic):
+    """Test each value is normalized as normalize_characteristic_value would."""
+    values = ["5", "1", "3", "9", "", "obvious", "1"]
+    expected = [
+        normalizer.normalize_characteristic_value(characteristic, value)
+        for value in values
+    ]
+
+    assert normalizer.normalize_characteristic_values(characteristic, values) == expected
+
+
+def test_batch_preserves_order(normalizer):
+    """Test results line up with the input values."""
+    values = [str(v) for v in (5, 4, 3, 2, 1)]
+    results = normalizer.normalize_characteristic_values("subtlety", values)
+
+    assert len(results) == len(values)
+    assert results == [
+        normalizer.normalize_characteristic_value("subtlety", value) for value in values
+    ]
+    assert results[0] != results[-1]
+
+
+def test_unknown_characteristic_returns_copy(normalizer):
+    """Test unmapped characteristics return the values unchanged in a new list."""
+    values = ["1", "2"]
+    results = normalizer.normalize_characteristic_values("unknown", values)
+
+    assert results == values
+    assert results is not values
+
+
+def test_empty_values(normalizer):
+    """Test no values gives no results."""
+    assert normalizer.normalize_characteristic_values("subtlety", []) == []
+
+
+def test_database_synonyms_added_later_are_seen():
+    """Test a long-lived normalizer picks up synonyms added to the database."""
+    repo = FakeKeywordRepository()
+    normalizer = KeywordNormalizer(keyword_repo=repo)
+
+    assert normalizer.normalize("Spiculated Margin") == "spiculated margin"
+    repo.synonyms["spiculated margin"] = "Spiculation"
+    assert normalizer.normalize("spiculated margin") == "spiculation"
+
+
+def test_dictionary_terms_skip_database():
+    """Test terms found in the synonym map never reach the repository."""
+    repo = FakeKeywordRepository()
+    normalizer = KeywordNormalizer(keyword_repo=repo)
+    expected = KeywordNormalizer().normalize("lung")
+
+    assert normalizer.normalize("lung") == normalizer.normalize(" LUNG ") == expected
+    assert repo.lookups == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,100 @@
+"""
+Tests for prepared keyword searches.
+
+Run with: pytest -q tests/test_keyword_search_engine.py
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.ra_d_ps.keyword_normalizer import KeywordNormalizer
+from src.ra_d_ps.keyword_search_engine import KeywordSearchEngine
+
+
+class FakeKeywordRepository:
+    """In-memory stand-in for KeywordRepository.get_all_keywords."""
+
+    def __init__(self, keywords):
+        self.keywords = keywords
+        self.calls = 0
+
+    def get_all_keywords(self, limit=None):
+        self.calls += 1
+        return list(self.keywords)
+
+
+def _keyword(keyword_id, text, document_count):
+    return SimpleNamespace(
+        keyword_id=keyword_id,
+        keyword_text=text,
+        normalized_form=text,
+        category="body",
+        statistics=SimpleNamespace(document_count=document_count),
+        sources=[SimpleNamespace(source_file=f"paper{keyword_id}.pdf",
+                                 context=f"a {text} in the lung")],
+    )
+
+
+@pytest.fixture
+def repository():
+    """25 nodule keywords with distinct relevance plus one non-match."""
+    keywords = [
+        _keyword(i, f"nodule type {i}", document_count=i + 1) for i in range(25)
+    ]
+    keywords.append(_keyword(99, "emphysema", document_count=3))
+    return FakeKeywordRepository(keywords)
+
+
+@pytest.fixture
+def engine(repository):
+    return KeywordSearchEngine(repository, KeywordNormalizer())
+
+
+def test_plan_reused_across_pages(engine, repository):
+    """Test paging a prepared plan ranks the corpus once and covers every result."""
+    plan = engine.prepare("nodule")
+    pages = [plan.execute(page=page, page_size=10) for page in (1, 2, 3)]
+
+    assert repository.calls == 1
+    assert [len(p.results) for p in pages] == [10, 10, 5]
+    assert all(p.total_results == 25 for p in pages)
+    assert [r.keyword_id for p in pages for r in p.results] == [
+        r.keyword_id for r in plan.ranked_results
+    ]
+
+
+def test_plan_pages_match_search(engine):
+    """Test a plan's pages are the same pages search() returns."""
+    plan = engine.prepare("nodule")
+    for page in (1, 2, 3):
+        expected = engine.search("nodule", page=page, page_size=10)
+        actual = plan.execute(page=page, page_size=10)
+        assert [r.keyword_id for r in actual.results] == [
+            r.keyword_id for r in expected.results
+        ]
+
+
+def test_execute_reports_its_own_time(engine):
+    """Test later pages do not report the one-time prepare cost."""
+    plan = engine.prepare("nodule")
+    plan.prepare_time_ms = 1000.0
+
+    assert plan.execute(page=2, page_size=10).search_time_ms < 1000.0
+
+
+def test_search_reports_prepare_and_execute_time(engine, monkeypatch):
+    """Test search() still reports the whole query's time."""
+    prepare = engine.prepare
+
+    def slow_prepare(*args, **kwargs):
+        plan = prepare(*args, **kwargs)
+        plan.prepare_time_ms = 1000.0
+        return plan
+
+    monkeypatch.setattr(engine, "prepare", slow_prepare)
+    assert engine.search("nodule").search_time_ms >= 1000.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
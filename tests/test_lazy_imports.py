@@ -0,0 +1,46 @@
+"""
+Tests for the package's lazily imported public API.
+
+Run with: pytest -q tests/test_lazy_imports.py
+"""
+
+import pytest
+
+import src.ra_d_ps as ra_d_ps
+
+
+@pytest.fixture
+def fresh_package(monkeypatch):
+    """Drop cached lazy names so each test resolves them again."""
+    for name in ra_d_ps._LAZY_IMPORTS:
+        monkeypatch.delitem(vars(ra_d_ps), name, raising=False)
+    return ra_d_ps
+
+
+def test_optional_name_missing_from_module_is_none(fresh_package):
+    """Test an optional name its module does not define resolves to None."""
+    # The database/ package shadows database.py, so this name is not found
+    assert fresh_package.RadiologyDatabase is None
+
+
+def test_optional_name_failing_import_is_none(fresh_package, monkeypatch):
+    """Test an optional name whose module fails to import resolves to None."""
+    monkeypatch.setitem(fresh_package._LAZY_IMPORTS, "BatchProcessor", ".no_such_module")
+    assert fresh_package.BatchProcessor is None
+
+
+def test_required_name_missing_raises(fresh_package, monkeypatch):
+    """Test a required name still raises when it cannot be imported."""
+    monkeypatch.setitem(fresh_package._LAZY_IMPORTS, "detect_parse_case", ".no_such_module")
+    with pytest.raises(ImportError):
+        fresh_package.detect_parse_case
+
+
+def test_unknown_name_raises_attribute_error(fresh_package):
+    """Test names outside the public API raise AttributeError."""
+    with pytest.raises(AttributeError):
+        fresh_package.not_a_public_name
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,103 @@
+"""
+Tests for the detect_parse_case result cache.
+
+Run with: pytest -q tests/test_parse_case_cache.py
+"""
+
+import os
+
+import pytest
+
+from src.ra_d_ps import parser
+
+
+@pytest.fixture
+def xml_file(tmp_path, parse_case_xml):
+    """A Complete_Attributes XML file."""
+    path = tmp_path / "case.xml"
+    path.write_text(parse_case_xml["Complete_Attributes"])
+    return str(path)
+
+
+@pytest.fixture
+def uncached_calls(monkeypatch):
+    """Record every file detect_parse_case actually parses."""
+    calls = []
+    uncached = parser._detect_parse_case_uncached
+
+    def counting(file_path):
+        calls.append(file_path)
+        return uncached(file_path)
+
+    monkeypatch.setattr(parser, "_detect_parse_case_uncached", counting)
+    return calls
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    """Point the parse case cache at a shelve file for one test."""
+    cache_path = tmp_path / "parse_case_cache"
+    parser.set_parse_case_cache(str(cache_path))
+    yield cache_path
+    parser.set_parse_case_cache(None)
+
+
+def test_memory_cache_by_default():
+    """Test no cache file is used unless one is configured."""
+    parser.set_parse_case_cache(None)
+    assert isinstance(parser._get_parse_case_cache(), dict)
+
+
+def test_miss_then_hit(xml_file, uncached_calls, disk_cache):
+    """Test a file is parsed once and then answered from the cache."""
+    assert parser.detect_parse_case(xml_file) == "Complete_Attributes"
+    assert parser.detect_parse_case(xml_file) == "Complete_Attributes"
+    assert uncached_calls == [xml_file]
+
+
+def test_hit_survives_reopen(xml_file, uncached_calls, disk_cache):
+    """Test results persist in the cache file across reopening it."""
+    parser.detect_parse_case(xml_file)
+    parser.set_parse_case_cache(str(disk_cache))
+
+    assert parser.detect_parse_case(xml_file) == "Complete_Attributes"
+    assert uncached_calls == [xml_file]
+
+
+def test_stale_mtime_invalidates(xml_file, parse_case_xml, uncached_calls, disk_cache):
+    """Test rewriting a file makes its cached result stale."""
+    assert parser.detect_parse_case(xml_file) == "Complete_Attributes"
+
+    with open(xml_file, "w") as f:
+        f.write(parse_case_xml["Minimal_Attributes"])
+    st = os.stat(xml_file)
+    os.utime(xml_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert parser.detect_parse_case(xml_file) == "Minimal_Attributes"
+    assert uncached_calls == [xml_file, xml_file]
+
+
+def test_parse_errors_not_cached(tmp_path, parse_case_xml, uncached_calls, disk_cache):
+    """Test unparseable files are retried on every call."""
+    bad = tmp_path / "bad.xml"
+    bad.write_text(parse_case_xml["XML_Parse_Error"])
+
+    assert parser.detect_parse_case(str(bad)) == "XML_Parse_Error"
+    assert parser.detect_parse_case(str(bad)) == "XML_Parse_Error"
+    assert len(uncached_calls) == 2
+
+
+def test_corrupt_cache_falls_back(xml_file, tmp_path):
+    """Test an unreadable cache file does not break classification."""
+    cache_path = tmp_path / "corrupt_cache"
+    cache_path.write_bytes(b"not a dbm file")
+    parser.set_parse_case_cache(str(cache_path))
+    try:
+        assert parser.detect_parse_case(xml_file) == "Complete_Attributes"
+        assert isinstance(parser._get_parse_case_cache(), dict)
+    finally:
+        parser.set_parse_case_cache(None)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
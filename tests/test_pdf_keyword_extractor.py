@@ -0,0 +1,121 @@
+"""
+Tests for PDF page reading in the PDF keyword extractor.
+
+Run with: pytest -q tests/test_pdf_keyword_extractor.py
+"""
+
+import gc
+import weakref
+from concurrent.futures import Future
+
+import pytest
+
+pytest.importorskip("pdfplumber")
+
+from src.ra_d_ps.pdf_keyword_extractor import (
+    MIN_PAGES_PER_WORKER,
+    _read_pdf_pages,
+    _read_pdfs_ahead,
+)
+
+
+def _write_pdf(path, page_texts):
+    """Write a minimal PDF with one line of Helvetica text per page."""
+    n = len(page_texts)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [" + b" ".join(
+            b"%d 0 R" % (4 + 2 * i) for i in range(n)
+        ) + b"] /Count %d >>" % n,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(page_texts):
+        stream = b"BT /F1 12 Tf 72 720 Td (" + text.encode("latin-1") + b") Tj ET"
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * i)
+        )
+        objects.append(
+            b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+        )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref
+    )
+    path.write_bytes(bytes(out))
+
+
+@pytest.fixture
+def long_pdf(tmp_path):
+    """A PDF long enough to be split across three page workers."""
+    path = tmp_path / "long.pdf"
+    _write_pdf(path, [f"Page {i} nodule" for i in range(1, 3 * MIN_PAGES_PER_WORKER + 2)])
+    return path
+
+
+def test_serial_reads_every_page_in_order(long_pdf):
+    """Test the in-process read returns each page's text in page order."""
+    _, first_page_text, page_texts = _read_pdf_pages(long_pdf)
+
+    assert page_texts == [f"Page {i} nodule" for i in range(1, len(page_texts) + 1)]
+    assert first_page_text == page_texts[0]
+
+
+@pytest.mark.parametrize("max_pages", [None, 9, -2])
+def test_parallel_split_matches_serial(long_pdf, max_pages):
+    """Test splitting pages across worker processes returns the same texts."""
+    serial = _read_pdf_pages(long_pdf, max_pages, max_workers=1)
+    parallel = _read_pdf_pages(long_pdf, max_pages, max_workers=3)
+
+    assert parallel == serial
+
+
+def test_missing_pdf_raises(tmp_path):
+    """Test a missing path fails before any worker starts."""
+    with pytest.raises(FileNotFoundError):
+        _read_pdf_pages(tmp_path / "missing.pdf", max_workers=3)
+
+
+class FakePool:
+    """Executor stand-in that completes each read at submit time."""
+
+    def __init__(self):
+        self.submitted = []
+        self.live = weakref.WeakSet()
+
+    def submit(self, fn, path, max_pages):
+        future = Future()
+        future.set_result(("pages of", path))
+        self.submitted.append(path)
+        self.live.add(future)
+        return future
+
+
+def test_read_ahead_is_bounded():
+    """Test only a window of pdf reads is submitted or held at once, in order."""
+    pool = FakePool()
+    paths = [f"paper{i}.pdf" for i in range(10)]
+    window = 3
+
+    results = []
+    for i, read_pages in enumerate(_read_pdfs_ahead(pool, paths, None, window)):
+        results.append(read_pages())
+        del read_pages
+        gc.collect()
+        assert len(pool.submitted) <= i + 1 + window
+        assert len(pool.live) <= window + 1
+
+    assert results == [("pages of", path) for path in paths]
+    assert pool.submitted == paths
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,51 @@
+"""
+Tests for the SQLite radiology database.
+
+Run with: pytest -q tests/test_radiology_database.py
+"""
+
+import pytest
+from pathlib import Path
+import tempfile
+import shutil
+
+from src.ra_d_ps.radiology_database import RadiologyDatabase
+
+
+class TestRadiologyDatabase:
+    """Test RadiologyDatabase connection handling."""
+
+    @pytest.fixture
+    def db_path(self):
+        """Database file in a temporary directory."""
+        temp_path = Path(tempfile.mkdtemp())
+        yield temp_path / "test.db"
+        shutil.rmtree(temp_path)
+
+    def test_close_is_idempotent(self, db_path):
+        """Test closing inside the context manager does not break __exit__."""
+        with RadiologyDatabase(str(db_path)) as db:
+            db.close()
+
+        assert db.conn is None
+        db.close()
+
+    def test_default_journal_mode_unchanged(self, db_path):
+        """Test the database file keeps SQLite's default rollback journal."""
+        db = RadiologyDatabase(str(db_path))
+        mode = db.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        db.close()
+
+        assert mode == "delete"
+        assert sorted(p.name for p in db_path.parent.iterdir()) == ["test.db"]
+
+    def test_wal_opt_in(self, db_path):
+        """Test WAL journaling is enabled only when requested."""
+        with RadiologyDatabase(str(db_path), wal=True) as db:
+            mode = db.conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert mode == "wal"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
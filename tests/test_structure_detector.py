@@ -0,0 +1,69 @@
+"""
+Tests for batch structure detection.
+
+Run with: pytest -q tests/test_structure_detector.py
+"""
+
+import pytest
+
+from src.ra_d_ps import structure_detector
+from src.ra_d_ps.structure_detector import XMLStructureDetector
+
+
+class FakeParseCaseRepository:
+    """Stand-in for the PostgreSQL parse case repository."""
+
+    def get_parse_case_by_name(self, name):
+        return None
+
+
+def _describe_features(header_info, session_info, char_info):
+    """Classifier standing in for the database rules: echoes the features."""
+    return repr((sorted(header_info.items()), sorted(session_info.items()),
+                 sorted(char_info.items())))
+
+
+@pytest.fixture
+def make_detector(monkeypatch):
+    """Build detectors without a database, classifying by raw features."""
+    monkeypatch.setattr(structure_detector, "ParseCaseRepository",
+                        FakeParseCaseRepository, raising=False)
+    monkeypatch.setattr(structure_detector, "DATABASE_AVAILABLE", True)
+
+    def make():
+        detector = XMLStructureDetector()
+        detector._classify_structure = _describe_features
+        return detector
+
+    return make
+
+
+def test_pool_matches_detect_structure_type(make_detector, xml_case_files):
+    """Test worker processes extract the same features detect_structure_type does."""
+    paths = list(reversed(list(xml_case_files))) + list(xml_case_files)[:2]
+    pooled = make_detector().batch_detect_structures(paths, workers=3, chunksize=2)
+    detector = make_detector()
+    serial = {path: detector.detect_structure_type(path) for path in paths}
+
+    assert pooled == serial
+    assert list(pooled) == list(serial)
+    assert all(
+        (case == "XML_Parse_Error") == (xml_case_files[path] == "XML_Parse_Error")
+        for path, case in pooled.items()
+    )
+    assert len(set(pooled.values())) == len(set(xml_case_files.values()))
+
+
+def test_detection_cache_skips_workers(make_detector, xml_case_files,
+                                       forbid_process_pool):
+    """Test files in the detector's detection cache are answered without a pool."""
+    detector = make_detector()
+    paths = [p for p, case in xml_case_files.items() if case != "XML_Parse_Error"]
+    expected = detector.batch_detect_structures(paths, workers=2)
+
+    forbid_process_pool(structure_detector)
+    assert detector.batch_detect_structures(paths) == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
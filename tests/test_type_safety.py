@@ -19,34 +19,34 @@ def test_type_safe_operations():
     df = pd.DataFrame(test_data)
     print(f"DataFrame created with {len(df)} rows")
     
+    # Blank row detection with mixed types, vectorized over the whole frame
+    as_str = df.astype(str)
+    blank_mask = (df.isna() | (as_str == "") | (as_str.apply(lambda col: col.str.lower()) == "nan")).all(axis=1)
+    
+    # Data row counting logic: rows before each row, by position, without rescanning the frame
+    data_row_counts = pd.Series(range(len(df)), index=df.index)
+    is_even_rows = data_row_counts % 2 == 0
+    
     # Test row enumeration (this was causing the error)
     for row_idx, (_, row_data) in enumerate(df.iterrows(), start=2):
         print(f"Row {row_idx}: FileID={row_data['FileID']}")
         
-        # Test blank row detection with mixed types
-        try:
-            is_blank_row = all(
-                str(value) == "" or value is None or 
-                (hasattr(pd, 'isna') and pd.isna(value)) or
-                str(value).lower() == 'nan'
-                for value in row_data
-            )
-            print(f"  Blank row check: {is_blank_row}")
-        except Exception as e:
-            print(f"  Blank row check failed: {e}")
+        # Per-value blank check with mixed types must agree with the vectorized mask
+        is_blank_row = all(
+            str(value) == "" or value is None or
+            pd.isna(value) or
+            str(value).lower() == 'nan'
+            for value in row_data
+        )
+        assert is_blank_row == blank_mask.iloc[row_idx - 2]
+        print(f"  Blank row check: {is_blank_row}")
         
-        # Test data row counting logic
-        try:
-            data_row_count = 0
-            for prev_idx, (_, prev_row) in enumerate(df.iterrows()):
-                if prev_idx >= (row_idx - 2):  # This was the problematic comparison
-                    break
-                data_row_count += 1
-            
-            is_even_row = data_row_count % 2 == 0
-            print(f"  Data row count: {data_row_count}, Even: {is_even_row}")
-        except Exception as e:
-            print(f"  Row counting failed: {e}")
+        # Rows before this one, counted by position like the original row_idx - 2 bound
+        data_row_count = data_row_counts.iloc[row_idx - 2]
+        assert data_row_count == row_idx - 2
+        print(f"  Data row count: {data_row_count}, Even: {is_even_rows.iloc[row_idx - 2]}")
+    
+    assert not blank_mask.any()
     
     # Test MISSING value detection with mixed types
     missing_count = 0